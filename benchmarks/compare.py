@@ -0,0 +1,50 @@
+"""Compares two JSON reports written by `benchmarks/run.py`, for example before and after a commit.
+
+Lists, for each benchmark present in both reports, the ratio of the new time to the old one,
+flagging those slower or faster beyond a threshold, and exits with status 1 if any got slower.
+
+Typical usage example:
+
+  python benchmarks/compare.py before.json after.json --threshold 1.25
+"""
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict[tuple, dict]:
+    """Reads a report, indexing its results by function, api, kind, size and pattern."""
+    with open(path) as file:
+        results: list[dict] = json.load(file)["results"]
+    return {(r["function"], r["api"], r["kind"], r["size"], r["pattern"]): r for r in results}
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("old", help="JSON report taken as reference")
+    parser.add_argument("new", help="JSON report to be compared")
+    parser.add_argument("--threshold", type=float, default=1.25, help="time ratio beyond which a change is flagged")
+    parser.add_argument("--all", action="store_true", help="lists also the unchanged benchmarks")
+    options: argparse.Namespace = parser.parse_args()
+    old: dict[tuple, dict] = load(options.old)
+    new: dict[tuple, dict] = load(options.new)
+    slower: int = 0
+    for key in sorted(old.keys() & new.keys()):
+        ratio: float = new[key]["seconds"] / old[key]["seconds"]
+        memory: float = new[key]["peak_bytes"] / max(old[key]["peak_bytes"], 1)
+        if ratio > options.threshold:
+            flag: str = "SLOWER"
+            slower += 1
+        elif ratio < 1 / options.threshold:
+            flag = "faster"
+        else:
+            flag = ""
+        if flag or options.all:
+            function, api, kind, size, pattern = key
+            print(f"{function:40} {api:8} {kind:8} {size:>8} {pattern:10} time x{ratio:7.3f} memory x{memory:7.3f} {flag}")
+    print(f"{len(old.keys() & new.keys())} compared, {slower} slower", file=sys.stderr)
+    sys.exit(1 if slower > 0 else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""Times every method of `ring_seq.methods` and of `RingSeq` and writes the results as JSON.
+
+Each method is timed on `str`, `list`, `tuple` and `numpy.ndarray` rings
+of sizes from 10 to 10^6 elements, both aperiodic and periodic,
+reporting the best time, the time per element and the peak of allocated memory.
+
+Typical usage example:
+
+  python benchmarks/run.py --output before.json
+  python benchmarks/run.py --sizes 10 1000 --kinds str tuple --functions symmetry --output after.json
+  python benchmarks/compare.py before.json after.json
+
+The package is imported from `src`, as pytest does, so that the checked out code is timed without installing it.
+"""
+import argparse
+import inspect
+import json
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+# the checked out package, not an installed one
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from ring_seq import methods  # noqa: E402
+from ring_seq.RingSeq import RingSeq  # noqa: E402
+
+try:
+    import numpy
+except ImportError:  # NumPy is an optional dependency
+    numpy = None
+
+KINDS: tuple = ("str", "list", "tuple", "ndarray")
+SIZES: tuple = (10, 100, 1000, 10000, 100000, 1000000)
+PATTERNS: tuple = ("aperiodic", "periodic")
+
+# iterating these gives as many sequences as the elements, each as long as the ring
+QUADRATIC: set = {
+    "rotations", "reflections", "reversions", "rotations_and_reflections",
+    "distinct_rotations", "distinct_rotations_and_reflections"
+}
+
+# taking many sequences, benchmarked on a collection of rotations and reflections of the ring
+COLLECTIONS: set = {"group_by_rotation", "group_by_dihedral"}
+
+
+def make_ring(kind: str, size: int, pattern: str, seed: int = 0) -> Any:
+    """Builds a ring of random elements, aperiodic or repeating a unit of 10 elements."""
+    generator: random.Random = random.Random(seed)
+    if pattern == "periodic":
+        unit: list = [generator.randrange(4) for _ in range(10)]
+        elements: list = (unit * (size // 10 + 1))[:size]
+    else:
+        elements = [generator.randrange(4) for _ in range(size)]
+    if kind == "str":
+        return "".join(map(lambda e: "ACGT"[e], elements))
+    elif kind == "list":
+        return elements
+    elif kind == "tuple":
+        return tuple(elements)
+    else:
+        return numpy.array(elements)
+
+
+def arguments(name: str, ring: Any) -> list:
+    """Builds the arguments after the ring for the method with the given name."""
+    size: int = len(ring)
+    parameters: list = list(inspect.signature(getattr(methods, name)).parameters.values())[1:]
+    values: dict = {
+        "i": size // 3,
+        "step": size // 3,
+        "start": -1,
+        "end": size + size // 2,
+        "x": ring[-1],
+        "that": ring[size // 2:size // 2 + 8]
+    }
+    if name.startswith("is_"):
+        values["that"] = methods.reflect_at(ring, size // 3)
+    return [values[parameter.name] for parameter in parameters if parameter.default is inspect.Parameter.empty]
+
+
+def consume(result: Any) -> None:
+    """Walks the result if lazy, so that its whole cost is timed."""
+    if isinstance(result, Iterator):
+        deque(result, maxlen=0)
+
+
+def call(api: str, name: str, ring: Any, args: list) -> Callable[[], None]:
+    """Makes the timed call, in the original form or via the `RingSeq` wrapper."""
+    if name in COLLECTIONS:
+        rings: list = [ring, methods.rotate_left(ring, 1), methods.reflect_at(ring)]
+        return lambda: getattr(methods, name)(rings)
+    elif api == "methods":
+        f: Callable = getattr(methods, name)
+        return lambda: consume(f(ring, *args))
+    else:
+        wrapped: RingSeq = RingSeq(ring)
+        return lambda: consume(getattr(wrapped, name)(*args))
+
+
+def best_time(f: Callable[[], None], repeat: int, min_time: float) -> float:
+    """Gives the best time of a single call, repeating each measure until it lasts at least min_time."""
+    number: int = 1
+    while True:
+        start: float = time.perf_counter()
+        for _ in range(number):
+            f()
+        elapsed: float = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+    timings: list = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            f()
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def peak_bytes(f: Callable[[], None]) -> int:
+    """Gives the peak of memory allocated by a single call."""
+    tracemalloc.start()
+    try:
+        f()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def public_names() -> list[str]:
+    """Lists the public methods of `ring_seq.methods` that take a ring, all wrapped by `RingSeq`."""
+    return [
+        name for name, f in inspect.getmembers(methods, inspect.isfunction)
+        if not name.startswith("_") and f.__module__ == methods.__name__
+    ]
+
+
+def commit() -> str:
+    """Gives the git commit of the timed package, if any."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=ROOT
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run(names: list[str], apis: list[str], kinds: list[str], sizes: list[int], patterns: list[str],
+        quadratic_limit: int, repeat: int, min_time: float) -> list[dict]:
+    """Times all the combinations, skipping the quadratic methods on rings longer than quadratic_limit."""
+    results: list[dict] = []
+    for name in names:
+        for api in apis:
+            if api == "RingSeq" and (name in COLLECTIONS or not hasattr(RingSeq, name)):
+                continue
+            for kind in kinds:
+                for size in sizes:
+                    if name in QUADRATIC and size > quadratic_limit:
+                        continue
+                    for pattern in patterns:
+                        ring: Any = make_ring(kind, size, pattern)
+                        f: Callable[[], None] = call(api, name, ring, arguments(name, ring))
+                        seconds: float = best_time(f, repeat, min_time)
+                        results.append({
+                            "function": name,
+                            "api": api,
+                            "kind": kind,
+                            "size": size,
+                            "pattern": pattern,
+                            "seconds": seconds,
+                            "seconds_per_element": seconds / size,
+                            "peak_bytes": peak_bytes(f)
+                        })
+                        print(f"{name:40} {api:8} {kind:8} {size:>8} {pattern:10} {seconds:.3e}s", file=sys.stderr)
+    return results
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="-", help="JSON file to write, standard output by default")
+    parser.add_argument("--functions", default=".*", help="regular expression selecting the methods by name")
+    parser.add_argument("--apis", nargs="+", default=["methods", "RingSeq"], choices=["methods", "RingSeq"])
+    parser.add_argument("--kinds", nargs="+", default=list(KINDS), choices=KINDS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--patterns", nargs="+", default=list(PATTERNS), choices=PATTERNS)
+    parser.add_argument("--quadratic-limit", type=int, default=10000,
+                        help="largest size for the methods iterating all the transformations")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.05, help="least seconds for each measure")
+    options: argparse.Namespace = parser.parse_args()
+    kinds: list[str] = options.kinds
+    if numpy is None and "ndarray" in kinds:
+        kinds = [kind for kind in kinds if kind != "ndarray"]
+        print("NumPy is not installed, ndarray skipped", file=sys.stderr)
+    names: list[str] = [name for name in public_names() if re.search(options.functions, name)]
+    report: dict = {
+        "meta": {
+            "commit": commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": numpy.__version__ if numpy is not None else None,
+            "platform": platform.platform()
+        },
+        "results": run(names, options.apis, kinds, options.sizes, options.patterns, options.quadratic_limit,
+                       options.repeat, options.min_time)
+    }
+    if options.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+    else:
+        with open(options.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
-"""Contains the `RingSeq` class.
+"""Contains the `RingSeq` and `FrozenRingSeq` classes.
 
-Use `RingSeq` to enable dot notation.
+Use `RingSeq` to enable dot notation,
+`FrozenRingSeq` to also cache the invariants of an immutable sequence.
 
 Typical usage example:
 
@@ -23,6 +24,7 @@ class RingSeq:
     Attributes:
         underlying: The wrapped sequence.
     """
+    __slots__ = ("underlying",)
 
     def __init__(self, underlying: Seq):
         """Initializes the instance with the sequence."""
@@ -140,6 +142,82 @@ class RingSeq:
         """
         return reflect_at(self.underlying, i)
 
+    def rotate_right_view(self, step: int) -> RingView:
+        """Rotates the sequence to the right by some steps, without copying it.
+
+        Examples:
+          >>> list(RingSeq('ABC').rotate_right_view(1))
+          ['C', 'A', 'B']
+
+        Notes:
+          Is the lazy version of `rotate_right`, each element is read from the sequence when accessed.
+
+        Args:
+          step: number of rotation steps to the right
+
+        Returns:
+          The rotated view
+        """
+        return rotate_right_view(self.underlying, step)
+
+    def rotate_left_view(self, step: int) -> RingView:
+        """Rotates the sequence to the left by some steps, without copying it.
+
+        Examples:
+          >>> list(RingSeq('ABC').rotate_left_view(1))
+          ['B', 'C', 'A']
+
+        Notes:
+          Is the lazy version of `rotate_left`, each element is read from the sequence when accessed.
+
+        Args:
+          step: number of rotation steps to the left
+
+        Returns:
+          The rotated view
+        """
+        return rotate_left_view(self.underlying, step)
+
+    def start_at_view(self, i: IndexO) -> RingView:
+        """Rotates the sequence to start at some circular index, without copying it.
+
+        Examples:
+          >>> RingSeq('ABC').start_at_view(1)[0]
+          'B'
+          >>> RingSeq('ABC').start_at_view(1)[:]
+          'BCA'
+
+        Notes:
+          Is the lazy version of `start_at`, each element is read from the sequence when accessed.
+
+        Args:
+          i: circular index where the sequence starts
+
+        Returns:
+          The rotated view
+        """
+        return start_at_view(self.underlying, i)
+
+    def reflect_at_view(self, i: IndexO = 0) -> RingView:
+        """Reflects the sequence to start at some circular index, without copying it.
+
+        Examples:
+          >>> list(RingSeq('ABC').reflect_at_view())
+          ['A', 'C', 'B']
+          >>> RingSeq('ABC').reflect_at_view(1)[:]
+          'BAC'
+
+        Notes:
+          Is the lazy version of `reflect_at`, each element is read from the sequence when accessed.
+
+        Args:
+          i: circular index where the reflected sequence starts
+
+        Returns:
+          The reflected view
+        """
+        return reflect_at_view(self.underlying, i)
+
     def slice_o(self, start: IndexO, end: IndexO, step: int = 1) -> Seq:
         """Selects an interval of elements.
 
@@ -156,6 +234,7 @@ class RingSeq:
         Notes:
           Given the definition of circular sequence, a slice can contain more elements than the sequence itself.
           As shown in the examples, behaves differently from standard methods `[i:j]` and `[i:j:k]`.
+          Only the selected elements are copied, one standard slice for each time the ring is walked around.
 
         Args:
           start: circular index where the slice starts
@@ -170,6 +249,31 @@ class RingSeq:
         """
         return slice_o(self.underlying, start, end, step)
 
+    def islice_o(self, start: IndexO, end: IndexO, step: int = 1) -> Iterator[Any]:
+        """Iterates over an interval of elements, without building the slice.
+
+        Examples:
+          >>> list(RingSeq('ABC').islice_o(-1, 5))
+          ['C', 'A', 'B', 'C', 'A', 'B']
+          >>> list(RingSeq('ABC').islice_o(-1, 5, 2))
+          ['C', 'B', 'A']
+
+        Notes:
+          Is the lazy version of `slice_o`, useful for very long slices consumed only once.
+
+        Args:
+          start: circular index where the slice starts
+          end: circular index where the slice ends
+          step: number of steps for filtering
+
+        Returns:
+          The elements of the slice, with only the first element every each step
+
+        Raises:
+          ValueError: An error occurs if slice step is zero.
+        """
+        return islice_o(self.underlying, start, end, step)
+
     def rotations(self) -> Iterator[Seq]:
         """Computes all the rotations of this circular sequence
 
@@ -198,6 +302,7 @@ class RingSeq:
         Notes:
           Given the definition of circular sequence, the searched slice can contain more elements than the sequence itself.
           As shown in the examples, behaves differently from standard method `index(x[, i[, j]])`.
+          Runs without copying the sequence, see `index_of_slice_o` for searching sub-sequences of `list` and `tuple`.
 
         Args:
           x: sub-sequence to be found, can be a `str` or a single element from a `list` or from a `tuple`
@@ -212,6 +317,59 @@ class RingSeq:
         """
         return index_o(self.underlying, x, start, end)
 
+    def index_of_slice_o(self, that: Seq, start: IndexO = 0, end: IndexO = maxsize) -> Index:
+        """Gets the index of the first occurrence of a sub-sequence, also for `list` and `tuple`.
+
+        Examples:
+          >>> RingSeq([0, 1, 2, 3]).index_of_slice_o([3, 0, 1])
+          3
+          >>> RingSeq('ABC').index_of_slice_o('BCAB', 2, 8)
+          1
+
+        Notes:
+          Given the definition of circular sequence, the searched slice can contain more elements than the sequence itself.
+          Runs in linear time, without copying the sequence.
+
+        Args:
+          that: sub-sequence to be found, of the same type
+          start: circular index where the search starts
+          end: circular index where the search ends
+
+        Returns:
+          A standard index
+
+        Raises:
+          Value error: An error occurs if the sub-sequence is not found.
+        """
+        return index_of_slice_o(self.underlying, that, start, end)
+
+    def find_all_o(self, that: Seq, start: IndexO = 0, end: IndexO = maxsize, overlapping: bool = True) -> Iterator[Index]:
+        """Finds the indices of all the occurrences of a sub-sequence.
+
+        Examples:
+          >>> list(RingSeq('ABAB').find_all_o('BA'))
+          [1, 3]
+          >>> list(RingSeq([0, 0, 0]).find_all_o([0, 0]))
+          [0, 1, 2]
+          >>> list(RingSeq([0, 0, 0]).find_all_o([0, 0], overlapping=False))
+          [0, 2]
+
+        Notes:
+          Given the definition of circular sequence, an occurrence can cross the end of the sequence.
+          Each index is found at most once, as the search stops when the start is reached again.
+          Runs in linear time, without copying the sequence.
+
+        Args:
+          that: sub-sequence to be found, of the same type
+          start: circular index where the search starts
+          end: circular index where the search ends
+          overlapping: whether an occurrence can start before the previous one ends
+
+        Returns:
+          The standard indices where each occurrence starts, in order of search
+        """
+        return find_all_o(self.underlying, that, start, end, overlapping)
+
     def reflections(self) -> Iterator[Seq]:
         """Computes all the reflections of this circular sequence
 
@@ -254,6 +412,109 @@ class RingSeq:
         """
         return rotations_and_reflections(self.underlying)
 
+    def distinct_rotations(self) -> Iterator[Seq]:
+        """Computes the rotations of this circular sequence that are different from each other.
+
+        Examples:
+          >>> list(RingSeq('ABAB').distinct_rotations())
+          ['ABAB', 'BABA']
+          >>> list(RingSeq('').distinct_rotations())
+          []
+
+        Notes:
+          Each rotation is computed only once, the repetitions due to rotational symmetry are skipped.
+
+        Returns:
+          The sequence and its different rotations, 1 step at a time to the left
+        """
+        return distinct_rotations(self.underlying)
+
+    def distinct_rotations_and_reflections(self) -> Iterator[Seq]:
+        """Computes the rotations and reflections of this circular sequence that are different from each other.
+
+        Examples:
+          >>> list(RingSeq('ABAB').distinct_rotations_and_reflections())
+          ['ABAB', 'BABA']
+          >>> list(RingSeq('AABC').distinct_rotations_and_reflections())
+          ['AABC', 'ABCA', 'BCAA', 'CAAB', 'ACBA', 'CBAA', 'BAAC', 'AACB']
+
+        Notes:
+          Each transformation is computed only once, the repetitions due to rotational and reflectional symmetry are skipped.
+
+        Returns:
+          The sequence and its different rotations, and their different reflections
+        """
+        return distinct_rotations_and_reflections(self.underlying)
+
+    def orbit_size(self) -> int:
+        """Counts the rotations and reflections of this circular sequence that are different from each other.
+
+        Examples:
+          >>> RingSeq('ABAB').orbit_size()
+          2
+          >>> RingSeq('AABC').orbit_size()
+          8
+
+        Notes:
+          Runs in linear time, without computing any transformation.
+          The different rotations alone are as many as the elements of `primitive_period`.
+
+        Returns:
+          The number of elements of `distinct_rotations_and_reflections`
+        """
+        return orbit_size(self.underlying)
+
+    def rotation_views(self) -> Iterator[RingView]:
+        """Computes all the rotations of this circular sequence, without copying it.
+
+        Examples:
+          >>> list(map(lambda v: v[:], RingSeq('ABC').rotation_views()))
+          ['ABC', 'BCA', 'CAB']
+          >>> list(RingSeq('').rotation_views())
+          []
+
+        Notes:
+          Is the lazy version of `rotations`, each view is built in constant time and shares the sequence.
+
+        Returns:
+          The views of the sequence and its rotations, 1 step at a time to the left
+        """
+        return rotation_views(self.underlying)
+
+    def reflection_views(self) -> Iterator[RingView]:
+        """Computes all the reflections of this circular sequence, without copying it.
+
+        Examples:
+          >>> list(map(lambda v: v[:], RingSeq('ABC').reflection_views()))
+          ['ABC', 'ACB']
+          >>> list(RingSeq('').reflection_views())
+          []
+
+        Notes:
+          Is the lazy version of `reflections`, each view is built in constant time and shares the sequence.
+
+        Returns:
+          The views of the sequence and its reflection
+        """
+        return reflection_views(self.underlying)
+
+    def rotation_and_reflection_views(self) -> Iterator[RingView]:
+        """Computes all the rotations and reflections of this circular sequence, without copying it.
+
+        Examples:
+          >>> list(map(lambda v: v[:], RingSeq('ABC').rotation_and_reflection_views()))
+          ['ABC', 'BCA', 'CAB', 'ACB', 'CBA', 'BAC']
+          >>> list(RingSeq('').rotation_and_reflection_views())
+          []
+
+        Notes:
+          Is the lazy version of `rotations_and_reflections`, each view is built in constant time and shares the sequence.
+
+        Returns:
+          The views of the sequence and its rotations, and their reflections
+        """
+        return rotation_and_reflection_views(self.underlying)
+
     def is_rotation_of(self, that: Seq) -> bool:
         """Tests whether this circular sequence is a rotation of a given sequence.
 
@@ -263,6 +524,9 @@ class RingSeq:
           >>> RingSeq('ABC').is_rotation_of('ABC')
           True
 
+        Notes:
+          Runs in linear time, searching that in the ring walked twice, without computing any rotation.
+
         Args:
           that: sequence to be compared
 
@@ -280,6 +544,9 @@ class RingSeq:
           >>> RingSeq('ABC').is_reflection_of('ABC')
           True
 
+        Notes:
+          Runs in linear time, comparing elements in place without computing the reflection.
+
         Args:
           that: sequence to be compared
 
@@ -314,6 +581,9 @@ class RingSeq:
           >>> RingSeq('ABC').is_rotation_or_reflection_of('ABC')
           True
 
+        Notes:
+          Runs in linear time, searching that and its reversion in the ring walked twice.
+
         Args:
           that: sequence to be compared
 
@@ -322,6 +592,23 @@ class RingSeq:
         """
         return is_rotation_or_reflection_of(self.underlying, that)
 
+    def primitive_period(self) -> Seq:
+        """Finds the shortest sequence that repeated gives this circular sequence.
+
+        Examples:
+          >>> RingSeq('-|--|--|--|-').primitive_period()
+          '-|-'
+          >>> RingSeq('ABCAB').primitive_period()
+          'ABCAB'
+
+        Notes:
+          Runs in linear time, without computing any rotation.
+
+        Returns:
+          The repeating unit, whose length times the rotational symmetry order is the sequence length
+        """
+        return primitive_period(self.underlying)
+
     def rotational_symmetry(self) -> int:
         """Computes the order of rotational symmetry possessed by this circular sequence.
 
@@ -331,6 +618,9 @@ class RingSeq:
           >>> RingSeq('-|+-|+-|+-|+').rotational_symmetry()
           4
 
+        Notes:
+          Runs in linear time, without computing any rotation.
+
         Returns:
           The rotational symmetry order, that is the number >= 1 of rotations
           in which a circular sequence looks exactly the same
@@ -346,6 +636,9 @@ class RingSeq:
           >>> RingSeq('-|+-|+-|+-|+').symmetry_indices()
           []
 
+        Notes:
+          Runs in linear time, searching the repeating unit in its own reversion walked twice.
+
         Returns:
           The indices of each element close to an axis of reflectional symmetry,
           that is a line of symmetry that splits the sequence in two identical halves
@@ -363,9 +656,180 @@ class RingSeq:
 
         Notes:
           Reflectional symmetry is always lower or equal than rotational symmetry.
+          Runs in linear time.
 
         Returns:
           The reflectional (mirror) symmetry order, that is the number >= 0 of reflections
           in which a circular sequence looks exactly the same
         """
         return symmetry(self.underlying)
+
+    def canonical_index(self) -> Index:
+        """Finds the index where the lexicographically smallest rotation of this circular sequence starts.
+
+        Examples:
+          >>> RingSeq('CAB').canonical_index()
+          1
+          >>> RingSeq('ABAB').canonical_index()
+          0
+
+        Notes:
+          Runs in linear time, without computing any rotation.
+          If more rotations are equal, the smallest index is returned.
+
+        Returns:
+          A standard index, 0 if the sequence is empty
+        """
+        return canonical_index(self.underlying)
+
+    def canonical_rotation(self) -> Seq:
+        """Computes the lexicographically smallest rotation of this circular sequence.
+
+        Examples:
+          >>> RingSeq('CAB').canonical_rotation()
+          'ABC'
+          >>> RingSeq([2, 1, 3, 1]).canonical_rotation()
+          [1, 2, 1, 3]
+
+        Notes:
+          Is equivalent to `min(rotations(ring))`, but in linear time.
+          Two sequences are rotations of each other if and only if their canonical rotations are equal.
+
+        Returns:
+          The rotated sequence, starting at `canonical_index`
+        """
+        return canonical_rotation(self.underlying)
+
+    def canonical_bracelet(self) -> Seq:
+        """Computes the lexicographically smallest rotation or reflection of this circular sequence.
+
+        Examples:
+          >>> RingSeq('CBA').canonical_bracelet()
+          'ABC'
+          >>> RingSeq([1, 3, 2, 2]).canonical_bracelet()
+          [1, 2, 2, 3]
+
+        Notes:
+          Is equivalent to `min(rotations_and_reflections(ring))`, but in linear time.
+          Two sequences are rotations and/or reflections of each other if and only if their canonical bracelets are equal.
+
+        Returns:
+          The rotated, and possibly reflected, sequence
+        """
+        return canonical_bracelet(self.underlying)
+
+
+class FrozenRingSeq(RingSeq):
+    """Wrapper class for circular methods, caching the invariants of an immutable sequence.
+
+    Use this class instead of `RingSeq` when the symmetry and canonical methods are called repeatedly
+    on the same `str`, `tuple` or `bytes`: each invariant is computed at the first call only.
+
+    Examples:
+      >>> ring = FrozenRingSeq('-|--|--|--|-')
+      >>> ring.rotational_symmetry(), ring.symmetry_indices(), ring.canonical_index()
+      (4, [1, 4, 7, 10], 2)
+      >>> ring == FrozenRingSeq('-|--|--|--|-')
+      True
+
+    Notes:
+      Instances are hashable and equal if their sequences are equal,
+      `necklace_key` gives instead a key equal for all the rotations.
+
+    Attributes:
+        underlying: The wrapped sequence, not to be reassigned.
+    """
+    __slots__ = ("__length", "__period", "__symmetry_indices", "__canonical_index", "__necklace_key", "__hash")
+
+    def __init__(self, underlying: str | tuple | bytes):
+        """Initializes the instance with the immutable sequence.
+
+        Raises:
+          TypeError: if the sequence is not a `str`, a `tuple` or `bytes`.
+        """
+        if not isinstance(underlying, (str, tuple, bytes)):
+            raise TypeError("Unexpected type, only immutable str, tuple and bytes can be cached")
+        super().__init__(underlying)
+        self.__length = len(underlying)
+        self.__period = None
+        self.__symmetry_indices = None
+        self.__canonical_index = None
+        self.__necklace_key = None
+        self.__hash = None
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __hash__(self) -> int:
+        if self.__hash is None:
+            self.__hash = hash(self.underlying)
+        return self.__hash
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FrozenRingSeq):
+            return hash(self) == hash(other) and self.underlying == other.underlying
+        else:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"FrozenRingSeq({self.underlying!r})"
+
+    def __period_length(self) -> int:
+        if self.__period is None:
+            self.__period = len(primitive_period(self.underlying))
+        return self.__period
+
+    def primitive_period(self) -> Seq:
+        """Same as `RingSeq.primitive_period`, with the period length computed at the first call only."""
+        return self.underlying[:self.__period_length()]
+
+    def rotational_symmetry(self) -> int:
+        """Same as `RingSeq.rotational_symmetry`, with the period length computed at the first call only."""
+        if self.__length < 2:
+            return 1
+        else:
+            return self.__length // self.__period_length()
+
+    def symmetry_indices(self) -> list[Index]:
+        """Same as `RingSeq.symmetry_indices`, computed at the first call only."""
+        if self.__symmetry_indices is None:
+            self.__symmetry_indices = tuple(symmetry_indices(self.underlying))
+        return list(self.__symmetry_indices)
+
+    def symmetry(self) -> int:
+        """Same as `RingSeq.symmetry`, with the indices computed at the first call only."""
+        if self.__symmetry_indices is None:
+            self.symmetry_indices()
+        return len(self.__symmetry_indices)
+
+    def orbit_size(self) -> int:
+        """Same as `RingSeq.orbit_size`, with the invariants computed at the first call only."""
+        if self.__length == 0:
+            return 0
+        elif self.symmetry() > 0:
+            return self.__period_length()
+        else:
+            return 2 * self.__period_length()
+
+    def canonical_index(self) -> Index:
+        """Same as `RingSeq.canonical_index`, computed at the first call only."""
+        if self.__canonical_index is None:
+            self.__canonical_index = canonical_index(self.underlying)
+        return self.__canonical_index
+
+    def canonical_rotation(self) -> Seq:
+        """Same as `RingSeq.canonical_rotation`, with the index computed at the first call only."""
+        if self.__length == 0:
+            return self.underlying
+        else:
+            return start_at(self.underlying, self.canonical_index())
+
+    def necklace_key(self) -> NecklaceKey:
+        """Gives the key equal for all the rotations of this circular sequence, computed at the first call only.
+
+        Returns:
+          The `NecklaceKey` of the sequence, hashable in constant time
+        """
+        if self.__necklace_key is None:
+            self.__necklace_key = NecklaceKey(self.underlying)
+        return self.__necklace_key
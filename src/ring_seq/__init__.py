@@ -7,6 +7,12 @@ its elements forming a ring.
 Modules exported by this package:
 
 - `methods`: Contains all the library methods plus new types.
-- `RingSeq`: Contains the `RingSeq` class.
+- `RingSeq`: Contains the `RingSeq` and `FrozenRingSeq` classes.
+- `mapped`: Contains the `MappedRing` class, a ring read from a file of fixed-width records without loading it.
+- `buffer`: Contains the `RingBuffer` class, a mutable ring of fixed capacity.
+- `cache`: Contains an opt-in cache for the invariants of immutable sequences.
+- `profiling`: Contains an opt-in instrumentation counting copies, comparisons and time of each method.
+- `batch`: Contains the batch methods, for many rings at once (requires NumPy).
+- `parallel`: Contains the parallel methods, spreading many rings across processes.
 """
-from ring_seq.RingSeq import RingSeq
+from ring_seq.RingSeq import FrozenRingSeq, RingSeq
@@ -0,0 +1,212 @@
+"""Contains the batch methods, for many circular sequences of the same length at once.
+
+The circular sequences are the rows of a two-dimensional `numpy.ndarray`
+of shape (rings, length), each processed with vectorized operations
+on whole columns instead of a Python loop over the rows.
+Every method runs in O(rings * length * length) time,
+suited for many short rings.
+
+Requires NumPy.
+
+Typical usage example:
+  >>> rotational_symmetry_batch(numpy.array([[1, 2, 1, 2], [1, 2, 3, 4]])).tolist()
+  [2, 1]
+"""
+from typing import Any
+
+import numpy
+
+
+def __rows(rings: numpy.ndarray) -> numpy.ndarray:
+    rows: numpy.ndarray = numpy.asarray(rings)
+    if rows.ndim != 2:
+        raise ValueError("rings must be a two-dimensional array of shape (rings, length)")
+    return rows
+
+
+def __divisors(length: int) -> list[int]:
+    return [d for d in range(1, length) if length % d == 0]
+
+
+def __is_rotation_of_rows(rows: numpy.ndarray, thats: numpy.ndarray) -> numpy.ndarray:
+    # for each row, whether any rotation of it is equal to the matching row of thats
+    found: numpy.ndarray = numpy.zeros(rows.shape[0], dtype=bool)
+    for step in range(rows.shape[1]):
+        found |= (numpy.roll(rows, -step, axis=1) == thats).all(axis=1)
+    return found
+
+
+def __periods(rows: numpy.ndarray) -> numpy.ndarray:
+    length: int = rows.shape[1]
+    periods: numpy.ndarray = numpy.full(rows.shape[0], max(length, 1))
+    for divisor in reversed(__divisors(length)):
+        periods[(numpy.roll(rows, -divisor, axis=1) == rows).all(axis=1)] = divisor
+    return periods
+
+
+def __ranks(rows: numpy.ndarray) -> numpy.ndarray:
+    # elements replaced by numbers in the same order, for dtypes whose minimum cannot be computed
+    if rows.dtype.kind in "biuf":
+        return rows
+    else:
+        return numpy.unique(rows, return_inverse=True)[1].reshape(rows.shape)
+
+
+def __canonical_indices(rows: numpy.ndarray) -> numpy.ndarray:
+    # shrinks column by column the candidate starts, keeping those with the smallest element,
+    # until each row is left with a single candidate or all columns are compared
+    length: int = rows.shape[1]
+    ranks: numpy.ndarray = __ranks(rows)
+    twice: numpy.ndarray = numpy.concatenate((ranks, ranks), axis=1)
+    largest: Any = ranks.max()
+    candidates: numpy.ndarray = numpy.ones(rows.shape, dtype=bool)
+    pending: numpy.ndarray = numpy.arange(rows.shape[0])
+    for k in range(length):
+        column: numpy.ndarray = twice[pending, k:k + length]
+        smallest: numpy.ndarray = numpy.where(candidates[pending], column, largest).min(axis=1)
+        candidates[pending] &= column == smallest[:, None]
+        pending = pending[candidates[pending].sum(axis=1) > 1]
+    return candidates.argmax(axis=1)
+
+
+def canonical_rotation_batch(rings: numpy.ndarray) -> numpy.ndarray:
+    """Computes the lexicographically smallest rotation of each circular sequence.
+
+    Examples:
+      >>> canonical_rotation_batch(numpy.array([[3, 1, 2], [2, 1, 2]])).tolist()
+      [[1, 2, 3], [1, 2, 2]]
+
+    Notes:
+      Each row is equal to `canonical_rotation` of the matching ring.
+
+    Args:
+      rings: a two-dimensional array, one sequence per row
+
+    Returns:
+      An array of the same shape, each row rotated to start at its `canonical_index`
+
+    Raises:
+      ValueError: if rings is not two-dimensional
+    """
+    rows: numpy.ndarray = __rows(rings)
+    if rows.size == 0:
+        return rows.copy()
+    starts: numpy.ndarray = __canonical_indices(rows)
+    columns: numpy.ndarray = (starts[:, None] + numpy.arange(rows.shape[1])) % rows.shape[1]
+    return numpy.take_along_axis(rows, columns, axis=1)
+
+
+def __lexicographic_min_rows(rows: numpy.ndarray, others: numpy.ndarray) -> numpy.ndarray:
+    # for each row, the smallest of it and the matching row of others, decided at their first different column
+    different: numpy.ndarray = rows != others
+    first: numpy.ndarray = different.argmax(axis=1)[:, None]
+    is_smaller: numpy.ndarray = numpy.take_along_axis(different, first, axis=1) & (
+        numpy.take_along_axis(others, first, axis=1) < numpy.take_along_axis(rows, first, axis=1)
+    )
+    return numpy.where(is_smaller, others, rows)
+
+
+def canonical_bracelet_batch(rings: numpy.ndarray) -> numpy.ndarray:
+    """Computes the lexicographically smallest rotation or reflection of each circular sequence.
+
+    Examples:
+      >>> canonical_bracelet_batch(numpy.array([[1, 3, 2, 2], [2, 1, 2, 3]])).tolist()
+      [[1, 2, 2, 3], [1, 2, 3, 2]]
+
+    Notes:
+      Each row is equal to `canonical_bracelet` of the matching ring.
+
+    Args:
+      rings: a two-dimensional array, one sequence per row
+
+    Returns:
+      An array of the same shape, each row rotated, and possibly reflected
+
+    Raises:
+      ValueError: if rings is not two-dimensional
+    """
+    rows: numpy.ndarray = __rows(rings)
+    if rows.size == 0:
+        return rows.copy()
+    return __lexicographic_min_rows(canonical_rotation_batch(rows), canonical_rotation_batch(rows[:, ::-1]))
+
+
+def is_rotation_of_batch(rings: numpy.ndarray, that: numpy.ndarray) -> numpy.ndarray:
+    """Tests whether each circular sequence is a rotation of a given sequence.
+
+    Examples:
+      >>> is_rotation_of_batch(numpy.array([[1, 2, 3], [1, 3, 2]]), numpy.array([2, 3, 1])).tolist()
+      [True, False]
+      >>> is_rotation_of_batch(numpy.array([[1, 2, 3], [1, 3, 2]]), numpy.array([[2, 3, 1], [2, 1, 3]])).tolist()
+      [True, True]
+
+    Notes:
+      Each value is equal to `is_rotation_of` of the matching ring.
+
+    Args:
+      rings: a two-dimensional array, one sequence per row
+      that: a sequence compared with every row, or a two-dimensional array compared row by row
+
+    Returns:
+      A boolean array, one value per row
+
+    Raises:
+      ValueError: if rings is not two-dimensional
+    """
+    rows: numpy.ndarray = __rows(rings)
+    thats: numpy.ndarray = numpy.asarray(that)
+    if thats.shape[-1] != rows.shape[1] or rows.shape[1] == 0:
+        return numpy.zeros(rows.shape[0], dtype=bool)
+    return __is_rotation_of_rows(rows, thats)
+
+
+def rotational_symmetry_batch(rings: numpy.ndarray) -> numpy.ndarray:
+    """Computes the order of rotational symmetry possessed by each circular sequence.
+
+    Examples:
+      >>> rotational_symmetry_batch(numpy.array([[1, 2, 1, 2], [1, 1, 1, 1], [1, 2, 2, 1]])).tolist()
+      [2, 4, 1]
+
+    Notes:
+      Each value is equal to `rotational_symmetry` of the matching ring.
+      Only the rotations by a divisor of the length are compared.
+
+    Args:
+      rings: a two-dimensional array, one sequence per row
+
+    Returns:
+      An integer array, one rotational symmetry order per row
+
+    Raises:
+      ValueError: if rings is not two-dimensional
+    """
+    rows: numpy.ndarray = __rows(rings)
+    return max(rows.shape[1], 1) // __periods(rows)
+
+
+def symmetry_batch(rings: numpy.ndarray) -> numpy.ndarray:
+    """Computes the order of reflectional (mirror) symmetry possessed by each circular sequence.
+
+    Examples:
+      >>> symmetry_batch(numpy.array([[1, 2, 1, 2], [1, 1, 1, 1], [1, 2, 2, 1], [1, 2, 3, 4]])).tolist()
+      [2, 4, 1, 0]
+
+    Notes:
+      Each value is equal to `symmetry` of the matching ring.
+      A ring has reflectional symmetry if its reversion is one of its rotations,
+      and then as many axes as its rotational symmetry order.
+
+    Args:
+      rings: a two-dimensional array, one sequence per row
+
+    Returns:
+      An integer array, one reflectional symmetry order per row
+
+    Raises:
+      ValueError: if rings is not two-dimensional
+    """
+    rows: numpy.ndarray = __rows(rings)
+    if rows.shape[1] == 0:
+        return numpy.zeros(rows.shape[0], dtype=int)
+    is_symmetric: numpy.ndarray = __is_rotation_of_rows(rows[:, ::-1], rows)
+    return numpy.where(is_symmetric, rows.shape[1] // __periods(rows), 0)
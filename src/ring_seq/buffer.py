@@ -0,0 +1,220 @@
+"""Contains the `RingBuffer` class, a mutable circular sequence of fixed capacity.
+
+The elements are kept in a preallocated `list`, from a moving head position,
+so that adding and removing at both ends, and rotating a full buffer, move no other element.
+A `RingBuffer` can be passed, read-only, to all the library methods.
+
+Typical usage example:
+  >>> from ring_seq.methods import rotational_symmetry
+  >>> window = RingBuffer(4, 'ABAB')
+  >>> window.append('C')
+  >>> list(window), rotational_symmetry(window)
+  (['B', 'A', 'B', 'C'], 1)
+"""
+from collections.abc import Sequence
+from itertools import chain
+from typing import Any, Iterable, Iterator, Optional
+
+
+class RingBuffer(Sequence):
+    """A mutable sequence of fixed capacity, whose oldest elements are overwritten when full.
+
+    Examples:
+      >>> buffer = RingBuffer(3, [1, 2, 3])
+      >>> buffer.append(4)
+      >>> buffer
+      RingBuffer(3, [2, 3, 4])
+      >>> buffer.rotate_r(1)
+      >>> buffer[0], buffer[1:]
+      (4, [2, 3])
+
+    Notes:
+      Indexing, `append`, `appendleft`, `pop` and `popleft` take constant time,
+      rotating by k steps moves min(k, len - k) elements, none if the buffer is full.
+      Slicing copies only the selected elements, in a `list`,
+      so that the library methods building new sequences, as `slice_o` or `rotate_right`, give a `list`.
+
+    Attributes:
+        capacity: The maximum number of elements.
+    """
+    __slots__ = ("capacity", "__elements", "__head", "__length")
+
+    def __init__(self, capacity: int, iterable: Iterable[Any] = ()):
+        """Initializes the buffer with the last elements of the iterable fitting the capacity.
+
+        Raises:
+          ValueError: if the capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.__elements: list[Any] = [None] * capacity
+        self.__head: int = 0
+        self.__length: int = 0
+        self.extend(iterable)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __position(self, i: int) -> int:
+        # the position in the list of the element at the standard index i
+        if i < 0:
+            i += self.__length
+        if not 0 <= i < self.__length:
+            raise IndexError("RingBuffer index out of range")
+        return (self.__head + i) % self.capacity
+
+    def __segments(self, start: int, stop: int) -> tuple[range, range]:
+        # the positions in the list of the elements from start to stop, before and after the end of the list
+        first: int = self.__head + start
+        last: int = self.__head + stop
+        if last <= self.capacity:
+            return range(first, last), range(0)
+        elif first >= self.capacity:
+            return range(first - self.capacity, last - self.capacity), range(0)
+        else:
+            return range(first, self.capacity), range(0, last - self.capacity)
+
+    def __getitem__(self, i: int | slice) -> Any:
+        if isinstance(i, slice):
+            selected: range = range(self.__length)[i]
+            if selected.step == 1 and len(selected) > 0:
+                before, after = self.__segments(selected.start, selected.stop)
+                return self.__elements[before.start:before.stop] + self.__elements[after.start:after.stop]
+            else:
+                return list(map(lambda j: self.__elements[(self.__head + j) % self.capacity], selected))
+        return self.__elements[self.__position(i)]
+
+    def __setitem__(self, i: int, x: Any) -> None:
+        self.__elements[self.__position(i)] = x
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self.__elements.__getitem__, chain(*self.__segments(0, self.__length)))
+
+    def index(self, x: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """Gets the standard index of the first element equal to x.
+
+        Raises:
+          ValueError: if no element is equal to x.
+        """
+        start, stop, _ = slice(start, stop).indices(self.__length)
+        if start < stop:
+            for segment in self.__segments(start, stop):
+                try:
+                    found: int = self.__elements.index(x, segment.start, segment.stop)
+                    return (found - self.__head) % self.capacity
+                except ValueError:
+                    pass
+        raise ValueError(f"{x!r} is not in RingBuffer")
+
+    def __contains__(self, x: Any) -> bool:
+        try:
+            self.index(x)
+            return True
+        except ValueError:
+            return False
+
+    def is_full(self) -> bool:
+        """Tests whether the next element added will overwrite another one."""
+        return self.__length == self.capacity
+
+    def append(self, x: Any) -> None:
+        """Adds an element at the end, overwriting the first one if full."""
+        if self.is_full():
+            self.__elements[self.__head] = x
+            self.__head = (self.__head + 1) % self.capacity
+        else:
+            self.__elements[(self.__head + self.__length) % self.capacity] = x
+            self.__length += 1
+
+    def appendleft(self, x: Any) -> None:
+        """Adds an element at the start, overwriting the last one if full."""
+        self.__head = (self.__head - 1) % self.capacity
+        self.__elements[self.__head] = x
+        if not self.is_full():
+            self.__length += 1
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Adds the elements at the end, in order, overwriting the first ones if full."""
+        for x in iterable:
+            self.append(x)
+
+    def pop(self) -> Any:
+        """Removes and returns the last element.
+
+        Raises:
+          IndexError: if the buffer is empty.
+        """
+        position: int = self.__position(-1)
+        x: Any = self.__elements[position]
+        self.__elements[position] = None
+        self.__length -= 1
+        return x
+
+    def popleft(self) -> Any:
+        """Removes and returns the first element.
+
+        Raises:
+          IndexError: if the buffer is empty.
+        """
+        position: int = self.__position(0)
+        x: Any = self.__elements[position]
+        self.__elements[position] = None
+        self.__head = (self.__head + 1) % self.capacity
+        self.__length -= 1
+        return x
+
+    def clear(self) -> None:
+        """Removes all the elements."""
+        self.__elements = [None] * self.capacity
+        self.__head = 0
+        self.__length = 0
+
+    def rotate_r(self, step: int = 1) -> None:
+        """Rotates the elements to the right by some steps, in place.
+
+        Examples:
+          >>> buffer = RingBuffer(5, 'ABC')
+          >>> buffer.rotate_r(1)
+          >>> ''.join(buffer)
+          'CAB'
+
+        Args:
+          step: number of rotation steps to the right
+        """
+        if self.__length == 0:
+            return
+        k: int = step % self.__length
+        if self.is_full():
+            self.__head = (self.__head - k) % self.capacity
+        elif k <= self.__length - k:
+            for _ in range(k):
+                self.appendleft(self.pop())
+        else:
+            for _ in range(self.__length - k):
+                self.append(self.popleft())
+
+    def rotate_l(self, step: int = 1) -> None:
+        """Rotates the elements to the left by some steps, in place.
+
+        Examples:
+          >>> buffer = RingBuffer(5, 'ABC')
+          >>> buffer.rotate_l(1)
+          >>> ''.join(buffer)
+          'BCA'
+
+        Args:
+          step: number of rotation steps to the left
+        """
+        self.rotate_r(-step)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RingBuffer):
+            return len(self) == len(other) and all(map(lambda x, y: x == y, self, other))
+        else:
+            return NotImplemented
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return f"RingBuffer({self.capacity}, {list(self)!r})"
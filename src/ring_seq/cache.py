@@ -0,0 +1,141 @@
+"""Contains an opt-in, process-wide cache for the invariants of circular sequences.
+
+When enabled, the results of `rotational_symmetry`, `symmetry_indices`, `symmetry` and `canonical_index`
+are kept for the immutable, hashable sequences, `str`, `tuple` and `bytes`,
+and the least recently used are evicted beyond the maximum size.
+Other sequences are never cached.
+Only numbers and indices are kept, never sequences: `canonical_rotation` and `canonical_bracelet`
+use the cached `canonical_index`, but rotate the sequence they are given,
+as equal tuples, for example `(1, 0)` and `(True, False)`, share the same entry.
+
+Typical usage example:
+  >>> from ring_seq.methods import symmetry
+  >>> enable(maxsize=100)
+  >>> symmetry('-|--|--|--|-'), symmetry('-|--|--|--|-')
+  (4, 4)
+  >>> info()
+  CacheInfo(hits=1, misses=2, maxsize=100, currsize=2)
+  >>> disable()
+"""
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the cache, as given by `info`.
+
+    Attributes:
+        hits: The calls answered by the cache.
+        misses: The calls computed and then stored in the cache.
+        maxsize: The maximum number of results kept.
+        currsize: The number of results currently kept.
+    """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+__results: OrderedDict[tuple, Any] = OrderedDict()
+__lock: Lock = Lock()
+__state: dict[str, Any] = {"enabled": False, "maxsize": 0, "hits": 0, "misses": 0}
+
+
+def enable(maxsize: int = 4096) -> None:
+    """Starts caching, or changes the maximum size of the cache if already started.
+
+    Args:
+      maxsize: the maximum number of results kept, the least recently used are evicted first
+
+    Raises:
+      ValueError: if maxsize is not positive
+    """
+    if maxsize <= 0:
+        raise ValueError("maxsize must be positive")
+    with __lock:
+        __state["enabled"] = True
+        __state["maxsize"] = maxsize
+        while len(__results) > maxsize:
+            __results.popitem(last=False)
+
+
+def disable() -> None:
+    """Stops caching, discarding all the results and statistics."""
+    with __lock:
+        __state["enabled"] = False
+        __state["maxsize"] = 0
+    clear()
+
+
+def clear() -> None:
+    """Discards all the results and statistics, without stopping caching."""
+    with __lock:
+        __results.clear()
+        __state["hits"] = 0
+        __state["misses"] = 0
+
+
+def info() -> CacheInfo:
+    """Gives the statistics of the cache.
+
+    Notes:
+      The methods using other cached methods, for example `symmetry` using `symmetry_indices`,
+      count a hit or miss for each of them.
+
+    Returns:
+      The hits, misses, maximum size and current size
+    """
+    with __lock:
+        return CacheInfo(__state["hits"], __state["misses"], __state["maxsize"], len(__results))
+
+
+def __lookup(key: tuple) -> tuple[bool, Any]:
+    with __lock:
+        if key in __results:
+            __results.move_to_end(key)
+            __state["hits"] += 1
+            return True, __results[key]
+        else:
+            __state["misses"] += 1
+            return False, None
+
+
+def __store(key: tuple, result: Any) -> None:
+    with __lock:
+        if __state["enabled"]:
+            __results[key] = result
+            __results.move_to_end(key)
+            while len(__results) > __state["maxsize"]:
+                __results.popitem(last=False)
+
+
+def cached(f: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Makes a method of a single sequence use the cache, when enabled.
+
+    Args:
+      f: a method taking a sequence and returning an invariant of it, a number or a list of indices,
+        the same for all the equal sequences
+
+    Returns:
+      The method, answering from the cache for the `str`, `tuple` and `bytes` already seen
+    """
+    @wraps(f)
+    def wrapper(ring: Any) -> Any:
+        if not __state["enabled"] or not isinstance(ring, (str, tuple, bytes)):
+            return f(ring)
+        key: tuple = (f.__name__, type(ring), ring)
+        try:
+            is_found, result = __lookup(key)
+        except TypeError:  # a tuple with unhashable elements
+            return f(ring)
+        if not is_found:
+            result = f(ring)
+            __store(key, result)
+        if isinstance(result, list):
+            return list(result)
+        else:
+            return result
+
+    return wrapper
@@ -6,23 +6,35 @@ Usage example:
   >>> r.rotate_l(1)
   >>> r.current()
   'BCA'
+  >>> r[0], list(r)
+  ('B', ['B', 'C', 'A'])
 """
+from typing import Optional
+
 from ring_seq.methods import *
 
 
 class Ring:
     """An example class wrapping a sequence and keeping mutable states of rotation and reflection.
 
+    Updating the states takes constant time, whatever the length of the sequence.
+    Indexing, `ring[i]`, iteration and `len` read the sequence at the current states without copying it,
+    while `current()` copies it once for each new state.
+
     Attributes:
-        underlying: The wrapped sequence.
-        head_index: The state of rotation, a circular index of where the sequence currently starts, default = 0
+        underlying: The wrapped sequence, not to be modified.
+        head_index: The state of rotation, the standard index of where the sequence currently starts, default = 0
         is_reflected: The state of reflection
     """
     def __init__(self, underlying: Seq, head_index: IndexO = 0, is_reflected: bool = False):
         """Initializes the instance with the sequence and the states."""
         self.underlying = underlying
-        self.head_index = head_index
+        self.head_index = self.__normalized(head_index)
         self.is_reflected = is_reflected
+        self.__current: Optional[tuple[Index, bool, Seq]] = None
+
+    def __normalized(self, i: IndexO) -> Index:
+        return index_from(self.underlying, i) if len(self.underlying) > 0 else 0
 
     def __direction_multiplier(self) -> int:
         if self.is_reflected:
@@ -42,7 +54,7 @@ class Ring:
         Args:
           step: number of rotation steps to the right
         """
-        self.head_index += step * self.__direction_multiplier()
+        self.head_index = self.__normalized(self.head_index + step * self.__direction_multiplier())
 
     def rotate_l(self, step: int = 1):
         """Updates the rotation state by some steps to the left.
@@ -92,10 +104,49 @@ class Ring:
           >>> r.current()
           'CAB'
 
+        Notes:
+          The sequence is copied at the first call only, and again after the states change.
+
         Returns:
           The current sequence
         """
-        if self.is_reflected:
-            return reflect_at(self.underlying, self.head_index)
-        else:
-            return start_at(self.underlying, self.head_index)
+        if self.__current is None or self.__current[:2] != (self.head_index, self.is_reflected):
+            if self.is_reflected:
+                current: Seq = reflect_at(self.underlying, self.head_index)
+            else:
+                current = start_at(self.underlying, self.head_index)
+            self.__current = (self.head_index, self.is_reflected, current)
+        return self.__current[2]
+
+    def view(self) -> RingView:
+        """Gets a view of the sequence at the current rotation and reflection state, without copying it.
+
+        Examples:
+          >>> r = Ring('ABC')
+          >>> r.reflect()
+          >>> list(r.view())
+          ['A', 'C', 'B']
+
+        Notes:
+          The view keeps the states of when it is taken, not following their later changes.
+
+        Returns:
+          The current view
+        """
+        return RingView(self.underlying, self.head_index, self.is_reflected)
+
+    def __len__(self) -> int:
+        return len(self.underlying)
+
+    def __getitem__(self, i: Index | slice) -> Any:
+        if isinstance(i, slice):
+            return self.view()[i]
+        length: int = len(self.underlying)
+        if i < 0:
+            i += length
+        if not 0 <= i < length:
+            raise IndexError("Ring index out of range")
+        return self.underlying[(self.head_index - self.__direction_multiplier() * i) % length]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.view())
@@ -0,0 +1,180 @@
+"""Contains the `MappedRing` class, a circular sequence read from a file without loading it.
+
+The file holds fixed-width records, all described by the same `struct` format,
+and is mapped in memory with `mmap`: each record is read from the file at each access,
+so that rings larger than the available memory can be used with the library methods.
+
+Typical usage example:
+  >>> import tempfile
+  >>> with tempfile.NamedTemporaryFile(suffix='.bin') as file:
+  ...     _ = file.write(b'-|--|--|--|-')
+  ...     file.flush()
+  ...     with MappedRing(file.name) as ring:
+  ...         len(ring), ring[1], ring[2:4]
+  (12, 124, (45, 45))
+"""
+import mmap
+import os
+from collections.abc import Sequence
+from struct import Struct, calcsize, error
+from typing import Any, Iterator, Optional
+
+
+class MappedRing(Sequence):
+    """A read-only sequence of the fixed-width records of a file, mapped in memory.
+
+    Examples:
+      >>> import tempfile
+      >>> with tempfile.NamedTemporaryFile(suffix='.bin') as file:
+      ...     _ = file.write(bytes([1, 0, 2, 0, 3, 0]))
+      ...     file.flush()
+      ...     with MappedRing(file.name, '<H') as ring:
+      ...         list(ring), ring.index(3)
+      ([1, 2, 3], 2)
+
+    Notes:
+      Indexing reads a single record and slicing copies only the selected records, in a `tuple`,
+      so that the methods building new sequences, as `slice_o` or `rotate_right`, give a `tuple`,
+      while the views, as `rotate_right_view`, and the searches, as `index_o`, read the file in place.
+      `rotational_symmetry` compares the mapped file with itself shifted, once for each divisor of the length,
+      in constant memory instead of the linear one of the other sequences,
+      record by record when equal records can have different bytes, as floats with signed zeros.
+      Records with a single field are given as values, the others as tuples of values.
+      The file must not be resized while mapped.
+
+    Attributes:
+        path: The path of the mapped file.
+        format: The `struct` format of each record.
+        record_size: The number of bytes of each record.
+        records: The mapped file as a `memoryview`, cast to the format if a single native type,
+            otherwise of bytes.
+        is_comparable_in_place: Whether slices of `records` are equal exactly when their records are.
+    """
+    __slots__ = ("path", "format", "record_size", "records", "is_comparable_in_place", "__struct", "__is_cast",
+                 "__is_bytewise", "__is_single", "__length", "__map")
+
+    # the codes of the records whose equal values can have different bytes:
+    # floats with signed zeros, booleans, Pascal strings and pad bytes
+    __VALUE_CODES: str = "efd?px"
+
+    def __init__(self, path: str | os.PathLike, format: str = "B"):
+        """Maps the file, without reading it.
+
+        Raises:
+          ValueError: if the format is empty or the file size is not a multiple of the record size.
+        """
+        self.path = path
+        self.format = format
+        self.__struct = Struct(format)
+        self.record_size = self.__struct.size
+        if self.record_size == 0:
+            raise ValueError("Unexpected format, records must be at least one byte wide")
+        self.__is_single = len(self.__struct.unpack(bytes(self.record_size))) == 1
+        with open(path, "rb") as file:
+            size: int = os.fstat(file.fileno()).st_size
+            if size % self.record_size != 0:
+                raise ValueError(f"File size {size} is not a multiple of the record size {self.record_size}")
+            # an empty file cannot be mapped
+            self.__map: mmap.mmap | bytes = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size > 0 else b""
+        self.__length = size // self.record_size
+        self.records = memoryview(self.__map)
+        try:
+            self.records = self.records.cast(format)
+            self.__is_cast = True
+        except (TypeError, ValueError):  # not a single native type
+            self.__is_cast = False
+        self.__is_bytewise = not any(map(lambda code: code in format, self.__VALUE_CODES)) and not self.__is_padded()
+        # a cast memoryview compares by value, but booleans by their bytes
+        self.is_comparable_in_place = self.__is_bytewise or self.__is_cast and "?" not in format
+
+    def __is_padded(self) -> bool:
+        # whether the native alignment adds bytes not belonging to any field
+        try:
+            return self.record_size != calcsize("=" + self.format.lstrip("@=<>!"))
+        except error:  # native only types, as pointers
+            return True
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __element(self, values: tuple) -> Any:
+        return values[0] if self.__is_single else values
+
+    def __getitem__(self, i: int | slice) -> Any:
+        if isinstance(i, slice):
+            return self.__slice(i)
+        if i < 0:
+            i += self.__length
+        if not 0 <= i < self.__length:
+            raise IndexError("MappedRing index out of range")
+        if self.__is_cast:
+            return self.records[i]
+        else:
+            return self.__element(self.__struct.unpack_from(self.__map, i * self.record_size))
+
+    def __slice(self, s: slice) -> tuple:
+        if self.__is_cast:
+            return tuple(self.records[s].tolist())
+        selected: range = range(self.__length)[s]
+        if selected.step == 1:
+            raw: memoryview = self.records[selected.start * self.record_size:selected.stop * self.record_size]
+            return tuple(map(self.__element, self.__struct.iter_unpack(raw)))
+        else:
+            return tuple(map(self.__getitem__, selected))
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.__is_cast:
+            return iter(self.records)
+        else:
+            return map(self.__element, self.__struct.iter_unpack(self.records))
+
+    def __packed(self, x: Any) -> Optional[bytes]:
+        # the bytes of a record equal to x, if only the records with these bytes are equal to x
+        if not self.__is_bytewise:
+            return None
+        try:
+            packed: bytes = self.__struct.pack(*(x,) if self.__is_single else x)
+        except (error, TypeError):
+            return None
+        return packed if self.__element(self.__struct.unpack(packed)) == x else None
+
+    def index(self, x: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """Gets the index of the first record equal to x, searching the bytes of the file when possible.
+
+        Raises:
+          ValueError: if no record is equal to x.
+        """
+        start, stop, _ = slice(start, stop).indices(self.__length)
+        packed: Optional[bytes] = self.__packed(x)
+        if packed is None:
+            return super().index(x, start, stop)
+        position: int = start * self.record_size
+        while True:
+            found: int = self.__map.find(packed, position, stop * self.record_size)
+            if found < 0:
+                raise ValueError(f"{x!r} is not in MappedRing")
+            if found % self.record_size == 0:
+                return found // self.record_size
+            position = found + 1  # not aligned to a record
+
+    def __contains__(self, x: Any) -> bool:
+        try:
+            self.index(x)
+            return True
+        except ValueError:
+            return False
+
+    def close(self) -> None:
+        """Unmaps the file, after which the records can no longer be read."""
+        self.records.release()
+        if isinstance(self.__map, mmap.mmap):
+            self.__map.close()
+
+    def __enter__(self) -> "MappedRing":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"MappedRing({self.path!r}, {self.format!r})"
@@ -5,14 +5,35 @@ They add new operations to `list`, `tuple` and `str`
 for when such a sequence needs to be considered **circular**,
 its elements forming a ring.
 
+One-dimensional `numpy.ndarray` are supported as well, if NumPy is installed,
+with vectorized rotations and comparisons returning arrays.
+
+The binary sequences `bytes`, `bytearray`, `memoryview` and `array.array` are supported too,
+each method returning the same type it is given.
+A `memoryview` is never copied by comparisons and searches, and its reflections are views.
+The rotation and symmetry tests of a `memoryview` or an `array.array` compare it with itself in place,
+those of `bytes` and `bytearray` search it natively in a copy walked twice.
+
+Files of fixed-width records can be used as rings without loading them, see `ring_seq.mapped.MappedRing`.
+
 Typical usage example:
   >>> rotate_left('ABC', 1)
   'BCA'
 """
+from array import array
 from sys import maxsize
-from itertools import chain
-from typing import Any, Callable, Optional, Iterator, TypeAlias, TypeVar
-from math import ceil, fmod
+from collections.abc import Sequence
+from itertools import chain, islice
+from typing import Any, Callable, NamedTuple, Optional, Iterable, Iterator, TypeAlias, TypeVar
+from math import fmod, isqrt
+
+from ring_seq.cache import cached
+from ring_seq.mapped import MappedRing
+
+try:
+    import numpy
+except ImportError:  # NumPy is an optional dependency
+    numpy = None
 
 # For improved readability, the index of a collection
 Index: TypeAlias = int
@@ -21,7 +42,19 @@ Index: TypeAlias = int
 IndexO: TypeAlias = int
 
 # There are Sequence types, for example range, that is difficult to consider circular
-Seq = TypeVar("Seq", list, str, tuple)
+Seq = TypeVar("Seq", list, str, tuple, bytes, bytearray, memoryview, array, "numpy.ndarray")
+
+
+def __is_array(ring: Seq) -> bool:
+    return numpy is not None and isinstance(ring, numpy.ndarray)
+
+
+def __is_natively_searchable(ring: Seq, that: Any) -> bool:
+    # whether the sequence has a find method for sub-sequences as that
+    if isinstance(ring, str):
+        return True
+    else:
+        return isinstance(ring, (bytes, bytearray)) and isinstance(that, (bytes, bytearray))
 
 
 def index_from(ring: Seq, i: IndexO) -> Index:
@@ -93,8 +126,7 @@ def rotate_right(ring: Seq, step: int) -> Seq:
     Returns:
       The rotated sequence
     """
-    j: Index = len(ring) - index_from(ring, step)
-    return ring[j:] + ring[:j]
+    return __dihedral_copy(ring, index_from(ring, -step), False)
 
 
 def rotate_left(ring: Seq, step: int) -> Seq:
@@ -145,8 +177,42 @@ def __typed_assemble(t: type, iterator: Iterator[Any]) -> Seq:
         raise (TypeError("Unexpected type, currently str, list and tuple checked"))
 
 
+def __typed_concat(ring: Seq, pieces: Iterator[Seq]) -> Seq:
+    # a new sequence of the same type of ring
+    if isinstance(ring, (str, bytes, bytearray)):
+        return type(ring)().join(pieces)
+    elif isinstance(ring, memoryview):
+        contiguous: Iterator = map(lambda piece: piece if piece.contiguous else piece.tobytes(), pieces)
+        joined: memoryview = memoryview(b"".join(contiguous))
+        return joined if ring.format == "B" else joined.cast(ring.format)
+    elif isinstance(ring, array):
+        concatenated: array = array(ring.typecode)
+        for piece in pieces:
+            concatenated.extend(piece)
+        return concatenated
+    elif __is_array(ring):
+        return numpy.concatenate(list(pieces))
+    else:
+        return __typed_assemble(type(ring[:0]), chain.from_iterable(pieces))
+
+
 def __typed_reverse(ring: Seq) -> Seq:
-    return __typed_assemble(type(ring), reversed(ring))
+    # a view for `numpy.ndarray` and `memoryview`, a copy for the others
+    return ring[::-1]
+
+
+def __dihedral_copy(ring: Seq, head: Index, is_reflected: bool) -> Seq:
+    # the sequence started at head, walked backwards if reflected, assembled from two slices in a single copy
+    if is_reflected:
+        pieces: tuple[Seq, Seq] = (ring[head::-1], ring[:head:-1])
+    else:
+        pieces = (ring[head:], ring[:head])
+    if __is_array(ring):
+        return numpy.concatenate(pieces)
+    elif isinstance(ring, (str, list, tuple, bytes, bytearray)):
+        return pieces[0] + pieces[1]
+    else:
+        return __typed_concat(ring, iter(pieces))
 
 
 def reflect_at(ring: Seq, i: IndexO = 0) -> Seq:
@@ -160,6 +226,7 @@ def reflect_at(ring: Seq, i: IndexO = 0) -> Seq:
 
     Notes:
       `reflect_at(-1)` is equivalent to `reversed`.
+      Copies the sequence once, walking it backwards from the circular index.
 
     Args:
       ring: a sequence
@@ -168,7 +235,7 @@ def reflect_at(ring: Seq, i: IndexO = 0) -> Seq:
     Returns:
       The reflected sequence
     """
-    return __typed_reverse(start_at(ring, i + 1))
+    return __dihedral_copy(ring, index_from(ring, i), True)
 
 
 def slice_o(ring: Seq, start: IndexO, end: IndexO, step: int = 1) -> Seq:
@@ -187,6 +254,7 @@ def slice_o(ring: Seq, start: IndexO, end: IndexO, step: int = 1) -> Seq:
     Notes:
       Given the definition of circular sequence, a slice can contain more elements than the sequence itself.
       As shown in the examples, behaves differently from standard methods `[i:j]` and `[i:j:k]`.
+      Only the selected elements are copied, one standard slice for each time the ring is walked around.
 
     Args:
       ring: a sequence
@@ -206,17 +274,228 @@ def slice_o(ring: Seq, start: IndexO, end: IndexO, step: int = 1) -> Seq:
     if length == 0:
         return ring
     gap: int = end - start
-    if gap < 0 or step < 0:
+    if gap <= 0 or step < 0:
         return ring[:0]
     else:
-        times: int = int(ceil(gap / length) + 1)
-        all_elements: Seq = (start_at(ring, start) * times)[:gap]
-        if step == 1:
-            return all_elements
+        return __typed_concat(ring, __lap_slices(ring, index_from(ring, start), gap, step))
+
+
+def __lap_slices(ring: Seq, head: Index, gap: int, step: int) -> Iterator[Seq]:
+    # one standard slice for each time the ring is walked around
+    length: int = len(ring)
+    remaining: int = len(range(0, gap, step))
+    position: Index = head
+    while remaining > 0:
+        piece: Seq = ring[position:min(length, position + remaining * step):step]
+        yield piece
+        remaining -= len(piece)
+        position = (position + len(piece) * step) % length
+
+
+def islice_o(ring: Seq, start: IndexO, end: IndexO, step: int = 1) -> Iterator[Any]:
+    """Iterates over an interval of elements, without building the slice.
+
+    Examples:
+      >>> list(islice_o('ABC', -1, 5))
+      ['C', 'A', 'B', 'C', 'A', 'B']
+      >>> list(islice_o('ABC', -1, 5, 2))
+      ['C', 'B', 'A']
+
+    Notes:
+      Is the lazy version of `slice_o`, useful for very long slices consumed only once.
+
+    Args:
+      ring: a sequence
+      start: circular index where the slice starts
+      end: circular index where the slice ends
+      step: number of steps for filtering
+
+    Returns:
+      The elements of the slice, with only the first element every each step
+
+    Raises:
+      ValueError: An error occurs if slice step is zero.
+    """
+    if step == 0:
+        raise ValueError("slice step cannot be zero")
+    length: int = len(ring)
+    if length == 0 or end <= start or step < 0:
+        return iter(())
+    else:
+        head: Index = index_from(ring, start)
+        return map(lambda i: ring[i % length], range(head, head + end - start, step))
+
+
+def __prefix_table(pattern: Seq) -> list[int]:
+    table: list[int] = [0] * len(pattern)
+    k: int = 0
+    for i in range(1, len(pattern)):
+        while k > 0 and pattern[i] != pattern[k]:
+            k = table[k - 1]
+        if pattern[i] == pattern[k]:
+            k += 1
+        table[i] = k
+    return table
+
+
+def __circular_matches(ring: Seq, pattern: Seq, start: Index, size: int) -> Iterator[int]:
+    # offsets of all the occurrences of pattern in the first size elements of ring started at start
+    length: int = len(ring)
+    pattern_length: int = len(pattern)
+    if pattern_length == 0:
+        yield from range(size + 1)
+        return
+    table: list[int] = __prefix_table(pattern)
+    k: int = 0
+    for t in range(size):
+        element: Any = ring[(start + t) % length]
+        while k > 0 and element != pattern[k]:
+            k = table[k - 1]
+        if element == pattern[k]:
+            k += 1
+        if k == pattern_length:
+            yield t - pattern_length + 1
+            k = table[k - 1]
+
+
+def __array_matches(ring: Seq, pattern: Seq, start: Index, size: int) -> Iterator[int]:
+    # the same as __circular_matches, comparing the raw bytes of the elements when they allow it
+    pattern = numpy.asarray(pattern)
+    pattern_length: int = len(pattern)
+    if pattern_length == 0:
+        yield from range(size + 1)
+        return
+    if size < pattern_length:
+        return
+    text: numpy.ndarray = __typed_concat(ring, __lap_slices(ring, start, size, 1))
+    kinds: str = ring.dtype.kind + pattern.dtype.kind
+    is_raw_comparable: bool = set(kinds) <= set("biufc") or kinds in ("SS", "UU")
+    common: Optional[numpy.dtype] = numpy.result_type(ring.dtype, pattern.dtype) if is_raw_comparable else None
+    if common is None or common.kind not in kinds:  # for example int64 and uint64 would lose precision as float64
+        yield from __circular_matches(text.tolist(), pattern.tolist(), 0, size)
+        return
+    text = text.astype(common, copy=False)
+    pattern = pattern.astype(common)
+    if common.kind in "fc":
+        if numpy.isnan(pattern).any():
+            return
+        text += 0  # equal values +0.0 and -0.0 have different bytes
+        pattern += 0
+    text_bytes: bytes = text.tobytes()
+    pattern_bytes: bytes = pattern.tobytes()
+    width: int = common.itemsize
+    found: int = text_bytes.find(pattern_bytes)
+    while found >= 0:
+        misalignment: int = found % width
+        if misalignment == 0:
+            yield found // width
+            found = text_bytes.find(pattern_bytes, found + width)
         else:
-            filtered_indices: Iterator[Index] = filter(lambda i: i % step == 0, range(gap))
-            filtered_elements: Iterator[Any] = map(lambda i: all_elements[i], filtered_indices)
-            return __typed_assemble(type(ring), filtered_elements)
+            found = text_bytes.find(pattern_bytes, found + width - misalignment)
+
+
+def __matches_o(ring: Seq, pattern: Seq, start: Index, size: int) -> Iterator[int]:
+    if __is_array(ring):
+        return __array_matches(ring, pattern, start, size)
+    else:
+        return __circular_matches(ring, pattern, start, size)
+
+
+def __find_str_o(ring: str, x: str, start: Index, size: int) -> Optional[int]:
+    length: int = len(ring)
+    x_length: int = len(x)
+    if x_length > length:
+        found: int = slice_o(ring, start, start + size).find(x)
+        return None if found < 0 else found
+    offset: int = 0
+    head: Index = start
+    while offset + x_length <= size:
+        found: int = ring.find(x, head, min(length, head + size - offset))
+        if found >= 0:
+            return offset + found - head
+        lap: int = length - head
+        if offset + lap >= size:
+            return None
+        # only the few elements around the end of the ring are copied, to find occurrences crossing it
+        across_start: Index = max(head, length - x_length + 1)
+        across: str = ring[across_start:] + ring[:min(x_length - 1, size - offset - lap)]
+        found = across.find(x)
+        if found >= 0:
+            return offset + across_start - head + found
+        offset += lap
+        head = 0
+    return None
+
+
+def __find_element_o(ring: Seq, x: Any, start: Index, size: int) -> Optional[int]:
+    length: int = len(ring)
+    offset: int = 0
+    head: Index = start
+    while offset < size:
+        end: Index = min(length, head + size - offset)
+        if __is_array(ring):
+            found: numpy.ndarray = numpy.flatnonzero(ring[head:end] == x)
+            if found.size > 0:
+                return offset + int(found[0])
+        elif isinstance(ring, memoryview):
+            maybe_found: Optional[Index] = next(filter(lambda j: ring[j] == x, range(head, end)), None)
+            if maybe_found is not None:
+                return offset + maybe_found - head
+        else:
+            try:
+                return offset + ring.index(x, head, end) - head
+            except ValueError:
+                pass
+        offset += length - head
+        head = 0
+    return None
+
+
+def __find_slice_o(ring: Seq, that: Seq, start: Index, size: int) -> Optional[int]:
+    if __is_natively_searchable(ring, that):
+        return __find_str_o(ring, that, start, size)
+    else:
+        return next(__matches_o(ring, that, start, size), None)
+
+
+def __is_repeated_at(ring: Seq, that: Seq, i: Index) -> bool:
+    # whether that occurs at circular index i, copying only the elements crossing the end of the ring
+    head: Index = index_from(ring, i)
+    if head + len(that) <= len(ring):
+        return ring.startswith(that, head)
+    else:
+        return slice_o(ring, head, head + len(that)) == that
+
+
+def __find_all_slice_o(ring: Seq, that: Seq, start: Index, size: int) -> Iterator[int]:
+    if __is_natively_searchable(ring, that) and 0 < len(that) <= len(ring):
+        # no occurrence starts within the shortest period of that after another one,
+        # the next overlapping ones are a period apart as long as the ring goes on repeating that,
+        # so that each native search starts after the last occurrence and its elements are examined once
+        that_length: int = len(that)
+        period: int = that_length - __prefix_table(that)[-1]
+        repeated: Seq = that[that_length - period:]
+        offset: int = 0
+        while True:
+            maybe_found: Optional[int] = __find_str_o(ring, that, (start + offset) % len(ring), size - offset)
+            if maybe_found is None:
+                return
+            found: int = offset + maybe_found
+            yield found
+            while found + period + that_length <= size and __is_repeated_at(ring, repeated, start + found + that_length):
+                found += period
+                yield found
+            offset = found + period + 1
+    else:
+        yield from __matches_o(ring, that, start, size)
+
+
+def __non_overlapping(offsets: Iterator[int], gap: int) -> Iterator[int]:
+    allowed: int = 0
+    for offset in offsets:
+        if offset >= allowed:
+            yield offset
+            allowed = offset + gap
 
 
 def index_o(ring: Seq, x: Any, start: IndexO = 0, end: IndexO = maxsize) -> Index:
@@ -233,10 +512,12 @@ def index_o(ring: Seq, x: Any, start: IndexO = 0, end: IndexO = maxsize) -> Inde
     Notes:
       Given the definition of circular sequence, the searched slice can contain more elements than the sequence itself.
       As shown in the examples, behaves differently from standard method `index(x[, i[, j]])`.
+      Runs without copying the sequence, see `index_of_slice_o` for searching sub-sequences of `list` and `tuple`.
 
     Args:
       ring: a sequence
-      x: sub-sequence to be found, can be a `str` or a single element from a `list` or from a `tuple`
+      x: sub-sequence to be found, can be a `str`, `bytes` or `bytearray` in a sequence of the same kind,
+        or a single element from any other sequence
       start: circular index where the search starts
       end: circular index where the search ends
 
@@ -248,11 +529,320 @@ def index_o(ring: Seq, x: Any, start: IndexO = 0, end: IndexO = maxsize) -> Inde
     """
     length = len(ring)
     if length == 0:
+        if __is_array(ring) or isinstance(ring, memoryview):
+            raise ValueError("sub-sequence not found")
         return ring.index(x)
     else:
-        adjusted_to: int = min(end, start + length + len(x) - 1)
-        s: Seq = slice_o(ring, start, adjusted_to)
-        return index_from(ring, s.index(x) + start)
+        head: Index = index_from(ring, start)
+        if __is_natively_searchable(ring, x):
+            size: int = min(end, start + length + len(x) - 1) - start
+            maybe_found: Optional[int] = __find_str_o(ring, x, head, max(size, 0))
+        else:
+            size: int = min(end, start + length) - start
+            maybe_found: Optional[int] = __find_element_o(ring, x, head, size)
+        if maybe_found is None:
+            raise ValueError("sub-sequence not found")
+        return index_from(ring, maybe_found + start)
+
+
+def index_of_slice_o(ring: Seq, that: Seq, start: IndexO = 0, end: IndexO = maxsize) -> Index:
+    """Gets the index of the first occurrence of a sub-sequence, also for `list` and `tuple`.
+
+    Examples:
+      >>> index_of_slice_o([0, 1, 2, 3], [3, 0, 1])
+      3
+      >>> index_of_slice_o('ABC', 'BCAB', 2, 8)
+      1
+
+    Notes:
+      Given the definition of circular sequence, the searched slice can contain more elements than the sequence itself.
+      Runs in linear time, without copying the sequence.
+
+    Args:
+      ring: a sequence
+      that: sub-sequence to be found, of the same type
+      start: circular index where the search starts
+      end: circular index where the search ends
+
+    Returns:
+      A standard index
+
+    Raises:
+      Value error: An error occurs if the sub-sequence is not found.
+    """
+    length: int = len(ring)
+    if length == 0:
+        if len(that) == 0:
+            return 0
+        raise ValueError("sub-sequence not found")
+    else:
+        size: int = min(end, start + length + len(that) - 1) - start
+        maybe_found: Optional[int] = __find_slice_o(ring, that, index_from(ring, start), max(size, 0))
+        if maybe_found is None:
+            raise ValueError("sub-sequence not found")
+        return index_from(ring, maybe_found + start)
+
+
+def find_all_o(ring: Seq, that: Seq, start: IndexO = 0, end: IndexO = maxsize, overlapping: bool = True) -> Iterator[Index]:
+    """Finds the indices of all the occurrences of a sub-sequence.
+
+    Examples:
+      >>> list(find_all_o('ABAB', 'BA'))
+      [1, 3]
+      >>> list(find_all_o([0, 0, 0], [0, 0]))
+      [0, 1, 2]
+      >>> list(find_all_o([0, 0, 0], [0, 0], overlapping=False))
+      [0, 2]
+
+    Notes:
+      Given the definition of circular sequence, an occurrence can cross the end of the sequence.
+      Each index is found at most once, as the search stops when the start is reached again.
+      Runs in linear time, without copying the sequence.
+
+    Args:
+      ring: a sequence
+      that: sub-sequence to be found, of the same type
+      start: circular index where the search starts
+      end: circular index where the search ends
+      overlapping: whether an occurrence can start before the previous one ends
+
+    Returns:
+      The standard indices where each occurrence starts, in order of search
+    """
+    length: int = len(ring)
+    if length == 0:
+        return iter([0] if len(that) == 0 else [])
+    else:
+        size: int = min(end, start + length + len(that) - 1) - start
+        offsets: Iterator[int] = __find_all_slice_o(ring, that, index_from(ring, start), size)
+        if not overlapping:
+            offsets = __non_overlapping(offsets, max(len(that), 1))
+        return map(lambda offset: index_from(ring, offset + start), offsets)
+
+
+class RingView(Sequence):
+    """A read-only view of a circular sequence, rotated and possibly reflected, that copies no element.
+
+    Elements are read from the wrapped sequence at each access, only slicing builds a new sequence,
+    for example `view[:]` gives the same result as `start_at` or `reflect_at`.
+
+    Attributes:
+        underlying: The wrapped sequence.
+        head_index: The index of the wrapped sequence where the view starts.
+        is_reflected: Whether the view walks the wrapped sequence backwards.
+    """
+    __slots__ = ("underlying", "head_index", "is_reflected")
+
+    def __init__(self, underlying: Seq, head_index: IndexO = 0, is_reflected: bool = False):
+        """Initializes the view with the sequence and the states."""
+        self.underlying = underlying
+        self.head_index = index_from(underlying, head_index) if len(underlying) > 0 else 0
+        self.is_reflected = is_reflected
+
+    def __direction(self) -> int:
+        if self.is_reflected:
+            return -1
+        else:
+            return 1
+
+    def __len__(self) -> int:
+        return len(self.underlying)
+
+    def __getitem__(self, i: Index | slice) -> Any:
+        length: int = len(self.underlying)
+        if isinstance(i, slice):
+            return self.__slice(*i.indices(length))
+        if i < 0:
+            i += length
+        if not 0 <= i < length:
+            raise IndexError("RingView index out of range")
+        return self.underlying[(self.head_index + self.__direction() * i) % length]
+
+    def __slice(self, start: Index, stop: Index, step: int) -> Seq:
+        count: int = len(range(start, stop, step))
+        if count == 0:
+            return self.underlying[:0]
+        first: IndexO = self.head_index + self.__direction() * start
+        delta: int = self.__direction() * step
+        last: IndexO = first + (count - 1) * delta
+        if delta > 0:
+            return slice_o(self.underlying, first, last + 1, delta)
+        else:
+            return slice_o(self.underlying, last, first + 1, -delta)[::-1]
+
+    def __iter__(self) -> Iterator[Any]:
+        length: int = len(self.underlying)
+        head: Index = self.head_index
+        if length == 0:
+            return iter(())
+        elif self.is_reflected:
+            return map(self.underlying.__getitem__, chain(range(head, -1, -1), range(length - 1, head, -1)))
+        else:
+            return map(self.underlying.__getitem__, chain(range(head, length), range(head)))
+
+    def __reversed__(self) -> Iterator[Any]:
+        return iter(RingView(self.underlying, self.head_index - self.__direction(), not self.is_reflected))
+
+    def __contains__(self, x: Any) -> bool:
+        return any(map(lambda element: element == x, self.underlying))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RingView) or type(other) is type(self.underlying):
+            return len(self) == len(other) and all(map(lambda a, b: a == b, self, other))
+        else:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RingView({self.underlying!r}, {self.head_index}, {self.is_reflected})"
+
+
+def rotate_right_view(ring: Seq, step: int) -> RingView:
+    """Rotates the sequence to the right by some steps, without copying it.
+
+    Examples:
+      >>> list(rotate_right_view('ABC', 1))
+      ['C', 'A', 'B']
+
+    Notes:
+      Is the lazy version of `rotate_right`, each element is read from the sequence when accessed.
+
+    Args:
+      ring: a sequence
+      step: number of rotation steps to the right
+
+    Returns:
+      The rotated view
+    """
+    return RingView(ring, -step)
+
+
+def rotate_left_view(ring: Seq, step: int) -> RingView:
+    """Rotates the sequence to the left by some steps, without copying it.
+
+    Examples:
+      >>> list(rotate_left_view('ABC', 1))
+      ['B', 'C', 'A']
+
+    Notes:
+      Is the lazy version of `rotate_left`, each element is read from the sequence when accessed.
+
+    Args:
+      ring: a sequence
+      step: number of rotation steps to the left
+
+    Returns:
+      The rotated view
+    """
+    return RingView(ring, step)
+
+
+def start_at_view(ring: Seq, i: IndexO) -> RingView:
+    """Rotates the sequence to start at some circular index, without copying it.
+
+    Examples:
+      >>> start_at_view('ABC', 1)[0]
+      'B'
+      >>> start_at_view('ABC', 1)[:]
+      'BCA'
+
+    Notes:
+      Is the lazy version of `start_at`, each element is read from the sequence when accessed.
+
+    Args:
+      ring: a sequence
+      i: circular index where the sequence starts
+
+    Returns:
+      The rotated view
+    """
+    return RingView(ring, i)
+
+
+def reflect_at_view(ring: Seq, i: IndexO = 0) -> RingView:
+    """Reflects the sequence to start at some circular index, without copying it.
+
+    Examples:
+      >>> list(reflect_at_view('ABC'))
+      ['A', 'C', 'B']
+      >>> reflect_at_view('ABC', 1)[:]
+      'BAC'
+
+    Notes:
+      Is the lazy version of `reflect_at`, each element is read from the sequence when accessed.
+
+    Args:
+      ring: a sequence
+      i: circular index where the reflected sequence starts
+
+    Returns:
+      The reflected view
+    """
+    return RingView(ring, i, True)
+
+
+class DihedralTransform(NamedTuple):
+    """A rotation, possibly followed by a reflection, of circular sequences, composed without copying any of them.
+
+    A chain of transformations is composed in constant time into a single one,
+    then applied to a sequence with a single copy, or as a view.
+
+    Examples:
+      >>> t = DihedralTransform.rotate_right(1).then(DihedralTransform.reflect_at())
+      >>> t = t.then(DihedralTransform.start_at(2))
+      >>> t
+      DihedralTransform(offset=-3, is_reflected=True)
+      >>> t.apply('ABCDE')
+      'CBAED'
+      >>> start_at(reflect_at(rotate_right('ABCDE', 1)), 2)
+      'CBAED'
+
+    Notes:
+      The offset is not normalized, being reduced modulo the length of each sequence the transformation is applied to.
+
+    Attributes:
+        offset: The circular index of the sequence where the transformed sequence starts.
+        is_reflected: Whether the transformed sequence walks the sequence backwards.
+    """
+    offset: IndexO = 0
+    is_reflected: bool = False
+
+    @staticmethod
+    def rotate_right(step: int) -> "DihedralTransform":
+        """The transformation of `rotate_right`."""
+        return DihedralTransform(-step)
+
+    @staticmethod
+    def rotate_left(step: int) -> "DihedralTransform":
+        """The transformation of `rotate_left`."""
+        return DihedralTransform(step)
+
+    @staticmethod
+    def start_at(i: IndexO) -> "DihedralTransform":
+        """The transformation of `start_at`."""
+        return DihedralTransform(i)
+
+    @staticmethod
+    def reflect_at(i: IndexO = 0) -> "DihedralTransform":
+        """The transformation of `reflect_at`."""
+        return DihedralTransform(i, True)
+
+    def then(self, other: "DihedralTransform") -> "DihedralTransform":
+        """Composes this transformation with another one, applied after it, in constant time."""
+        if self.is_reflected:
+            return DihedralTransform(self.offset - other.offset, not other.is_reflected)
+        else:
+            return DihedralTransform(self.offset + other.offset, other.is_reflected)
+
+    def apply(self, ring: Seq) -> Seq:
+        """Transforms the sequence, copying it once."""
+        if self.is_reflected:
+            return reflect_at(ring, self.offset)
+        else:
+            return start_at(ring, self.offset)
+
+    def view(self, ring: Seq) -> RingView:
+        """Transforms the sequence, without copying it."""
+        return RingView(ring, self.offset, self.is_reflected)
 
 
 def __transformations(ring: Seq, f: Callable[[Seq], Iterator[Seq]]) -> Iterator[Seq]:
@@ -343,8 +933,224 @@ def rotations_and_reflections(ring: Seq) -> Iterator[Seq]:
     return __transformations(ring, lambda r: __flat_map(rotations, reflections(r)))
 
 
-def __is_transformation_of(ring: Seq, that: Seq, f: Callable[[Seq], Iterator[Seq]]) -> bool:
-    return len(ring) == len(that) and that in f(ring)
+def __is_reflectional_symmetric(ring: Seq) -> bool:
+    return __reflection_axis(ring[:__period_length(ring)]) is not None
+
+
+def distinct_rotations(ring: Seq) -> Iterator[Seq]:
+    """Computes the rotations of this circular sequence that are different from each other.
+
+    Examples:
+      >>> list(distinct_rotations('ABAB'))
+      ['ABAB', 'BABA']
+      >>> list(distinct_rotations(''))
+      []
+
+    Notes:
+      Each rotation is computed only once, the repetitions due to rotational symmetry are skipped.
+
+    Args:
+      ring: a sequence
+
+    Returns:
+      The sequence and its different rotations, 1 step at a time to the left
+    """
+    return __transformations(ring, lambda r: map(lambda stp: rotate_left(r, stp), range(__period_length(r))))
+
+
+def distinct_rotations_and_reflections(ring: Seq) -> Iterator[Seq]:
+    """Computes the rotations and reflections of this circular sequence that are different from each other.
+
+    Examples:
+      >>> list(distinct_rotations_and_reflections('ABAB'))
+      ['ABAB', 'BABA']
+      >>> list(distinct_rotations_and_reflections('AABC'))
+      ['AABC', 'ABCA', 'BCAA', 'CAAB', 'ACBA', 'CBAA', 'BAAC', 'AACB']
+
+    Notes:
+      Each transformation is computed only once, the repetitions due to rotational and reflectional symmetry are skipped.
+
+    Args:
+      ring: a sequence
+
+    Returns:
+      The sequence and its different rotations, and their different reflections
+    """
+    def transformations(r: Seq) -> Iterator[Seq]:
+        if __is_reflectional_symmetric(r):
+            return distinct_rotations(r)
+        else:
+            return chain(distinct_rotations(r), distinct_rotations(reflect_at(r, 0)))
+
+    return __transformations(ring, transformations)
+
+
+def orbit_size(ring: Seq) -> int:
+    """Counts the rotations and reflections of this circular sequence that are different from each other.
+
+    Examples:
+      >>> orbit_size('ABAB')
+      2
+      >>> orbit_size('AABC')
+      8
+
+    Notes:
+      Runs in linear time, without computing any transformation.
+      The different rotations alone are as many as the elements of `primitive_period`.
+
+    Args:
+      ring: a sequence
+
+    Returns:
+      The number of elements of `distinct_rotations_and_reflections`
+    """
+    if len(ring) == 0:
+        return 0
+    elif __is_reflectional_symmetric(ring):
+        return __period_length(ring)
+    else:
+        return 2 * __period_length(ring)
+
+
+def rotation_views(ring: Seq) -> Iterator[RingView]:
+    """Computes all the rotations of this circular sequence, without copying it.
+
+    Examples:
+      >>> list(map(lambda v: v[:], rotation_views('ABC')))
+      ['ABC', 'BCA', 'CAB']
+      >>> list(rotation_views(''))
+      []
+
+    Notes:
+      Is the lazy version of `rotations`, each view is built in constant time and shares the sequence.
+
+    Args:
+      ring: a sequence
+
+    Returns:
+      The views of the sequence and its rotations, 1 step at a time to the left
+    """
+    return __transformations(ring, lambda r: map(lambda stp: RingView(r, stp), range(len(r))))
+
+
+def reflection_views(ring: Seq) -> Iterator[RingView]:
+    """Computes all the reflections of this circular sequence, without copying it.
+
+    Examples:
+      >>> list(map(lambda v: v[:], reflection_views('ABC')))
+      ['ABC', 'ACB']
+      >>> list(reflection_views(''))
+      []
+
+    Notes:
+      Is the lazy version of `reflections`, each view is built in constant time and shares the sequence.
+
+    Args:
+      ring: a sequence
+
+    Returns:
+      The views of the sequence and its reflection
+    """
+    return __transformations(ring, lambda r: iter([RingView(r), RingView(r, 0, True)]))
+
+
+def rotation_and_reflection_views(ring: Seq) -> Iterator[RingView]:
+    """Computes all the rotations and reflections of this circular sequence, without copying it.
+
+    Examples:
+      >>> list(map(lambda v: v[:], rotation_and_reflection_views('ABC')))
+      ['ABC', 'BCA', 'CAB', 'ACB', 'CBA', 'BAC']
+      >>> list(rotation_and_reflection_views(''))
+      []
+
+    Notes:
+      Is the lazy version of `rotations_and_reflections`, each view is built in constant time and shares the sequence.
+
+    Args:
+      ring: a sequence
+
+    Returns:
+      The views of the sequence and its rotations, and their reflections
+    """
+    return __transformations(ring, lambda r: chain(
+        map(lambda stp: RingView(r, stp), range(len(r))),
+        map(lambda stp: RingView(r, -stp, True), range(len(r)))
+    ))
+
+
+def __is_same_size_and_kind(ring: Seq, that: Seq) -> bool:
+    return len(ring) == len(that) and type(ring[:0]) is type(that[:0])
+
+
+def __are_equal(ring: Seq, that: Seq) -> bool:
+    if __is_array(ring):
+        return numpy.array_equal(ring, that)
+    elif type(ring) is type(that):
+        return ring == that
+    else:  # as a `MappedRing` and a `tuple`, of the same kind but never equal
+        return len(ring) == len(that) and all(map(lambda a, b: a == b, ring, that))
+
+
+def __is_binary(ring: Seq) -> bool:
+    # whether the sequence can be viewed as a memoryview, without copying it
+    return isinstance(ring, (memoryview, array))
+
+
+def __is_comparable_in_place(view: memoryview) -> bool:
+    # whether slices of the view are equal exactly when their elements are,
+    # a memoryview comparing the native numbers by value but booleans by their bytes
+    code: str = view.format.lstrip("@")
+    return len(code) == 1 and code in "bBhHiIlLqQnNfdc"
+
+
+def __are_rotations_equal(ring: memoryview, head: Index, that: memoryview, that_head: Index) -> bool:
+    # whether ring started at head is equal to that started at that_head, comparing slices of both in place
+    length: int = len(ring)
+    cuts: list[int] = sorted({0, length - head, length - that_head, length})
+
+    def segments(view: memoryview, start: Index) -> Iterator[memoryview]:
+        return map(lambda a, b: view[(start + a) % length:(start + a) % length + b - a], cuts, cuts[1:])
+
+    if __is_comparable_in_place(ring) and __is_comparable_in_place(that):
+        return all(map(lambda x, y: x == y, segments(ring, head), segments(that, that_head)))
+    else:
+        return all(map(
+            lambda x, y: x == y, chain.from_iterable(segments(ring, head)), chain.from_iterable(segments(that, that_head))
+        ))
+
+
+def __view_rotation_offset(ring: memoryview, that: memoryview) -> Optional[Index]:
+    # both started at their smallest rotation are equal if rotations, the offset being their distance up to the period
+    head: Index = __least_rotation_index(ring)
+    that_head: Index = __least_rotation_index(that)
+    if __are_rotations_equal(ring, head, that, that_head):
+        return (head - that_head) % __shifted_period_length(ring, ring, 1, __is_comparable_in_place(ring))
+    else:
+        return None
+
+
+def __rotation_offset(ring: Seq, that: Seq) -> Optional[Index]:
+    # the first step for which ring rotated to the left is equal to that, if any
+    if len(ring) == 0:
+        return None
+    elif __is_natively_searchable(ring, that):
+        found: int = (ring + ring).find(that)
+        return None if found < 0 else found
+    elif __is_binary(ring) and __is_binary(that):
+        return __view_rotation_offset(memoryview(ring), memoryview(that))
+    else:
+        return next(__matches_o(ring, that, 0, 2 * len(ring) - 1), None)
+
+
+def __contains_rotation(ring: Seq, that: Seq) -> bool:
+    return __rotation_offset(ring, that) is not None
+
+
+def __is_reflection_at_head(ring: Seq, that: Seq) -> bool:
+    if __is_array(ring):
+        return bool(ring[0] == that[0]) and numpy.array_equal(ring[:0:-1], that[1:])
+    else:
+        return all(map(lambda j: ring[-j] == that[j], range(len(ring))))
 
 
 def is_rotation_of(ring: Seq, that: Seq) -> bool:
@@ -356,6 +1162,9 @@ def is_rotation_of(ring: Seq, that: Seq) -> bool:
       >>> is_rotation_of('ABC', 'ABC')
       True
 
+    Notes:
+      Runs in linear time, searching that in the ring walked twice, without computing any rotation.
+
     Args:
       ring: a sequence
       that: sequence to be compared
@@ -363,7 +1172,7 @@ def is_rotation_of(ring: Seq, that: Seq) -> bool:
     Returns:
       True if equal to any rotation of that
     """
-    return __is_transformation_of(ring, that, lambda r: rotations(r))
+    return __is_same_size_and_kind(ring, that) and __contains_rotation(ring, that)
 
 
 def is_reflection_of(ring: Seq, that: Seq) -> bool:
@@ -375,6 +1184,9 @@ def is_reflection_of(ring: Seq, that: Seq) -> bool:
       >>> is_reflection_of('ABC', 'ABC')
       True
 
+    Notes:
+      Runs in linear time, comparing elements in place without computing the reflection.
+
     Args:
       ring: a sequence
       that: sequence to be compared
@@ -382,7 +1194,9 @@ def is_reflection_of(ring: Seq, that: Seq) -> bool:
     Returns:
       True if equal to any reflection of that
     """
-    return __is_transformation_of(ring, that, lambda r: reflections(r))
+    return __is_same_size_and_kind(ring, that) and len(ring) > 0 and (
+        __are_equal(ring, that) or __is_reflection_at_head(ring, that)
+    )
 
 
 def is_reversion_of(ring: Seq, that: Seq) -> bool:
@@ -401,7 +1215,9 @@ def is_reversion_of(ring: Seq, that: Seq) -> bool:
     Returns:
       True if equal to any reversion of that
     """
-    return __is_transformation_of(ring, that, lambda r: reversions(r))
+    return __is_same_size_and_kind(ring, that) and len(ring) > 0 and (
+        __are_equal(ring, that) or __are_equal(__typed_reverse(ring), that)
+    )
 
 
 def is_rotation_or_reflection_of(ring: Seq, that: Seq) -> bool:
@@ -413,6 +1229,9 @@ def is_rotation_or_reflection_of(ring: Seq, that: Seq) -> bool:
       >>> is_rotation_or_reflection_of('ABC', 'ABC')
       True
 
+    Notes:
+      Runs in linear time, searching that and its reversion in the ring walked twice.
+
     Args:
       ring: a sequence
       that: sequence to be compared
@@ -420,13 +1239,76 @@ def is_rotation_or_reflection_of(ring: Seq, that: Seq) -> bool:
     Returns:
       True if equal to any combination of rotation and reflection of that
     """
-    return __is_transformation_of(ring, that, lambda r: rotations_and_reflections(r))
+    return __is_same_size_and_kind(ring, that) and (
+        __contains_rotation(ring, that) or __contains_rotation(ring, __typed_reverse(that))
+    )
+
 
+def __divisors(length: int) -> list[int]:
+    smaller: list[int] = [d for d in range(1, isqrt(length) + 1) if length % d == 0]
+    return smaller + [length // d for d in reversed(smaller) if d * d != length]
 
-def __are_folds_symmetrical(ring: Seq, n: int) -> bool:
-    return rotate_right(ring, int(len(ring) / n)) == ring
+
+def __shifted_period_length(ring: Seq, records: memoryview, width: int, is_comparable_in_place: bool) -> int:
+    # the shortest rotation leaving the elements unchanged, comparing the ring with itself shifted, in place,
+    # by slices of its records, width for each element, when possible, otherwise element by element
+    length: int = len(ring)
+    if is_comparable_in_place:
+        return next(filter(
+            lambda d: records[d * width:] == records[:(length - d) * width], __divisors(length)
+        ))
+    else:
+        return next(filter(
+            lambda d: all(map(lambda x, y: x == y, islice(ring, d, None), ring)), __divisors(length)
+        ))
 
 
+def __period_length(ring: Seq) -> int:
+    length: int = len(ring)
+    if __is_array(ring):
+        maybe_offset: Optional[int] = next(__array_matches(ring, ring, 1, 2 * length - 2), None)
+        return length if maybe_offset is None else maybe_offset + 1
+    elif isinstance(ring, (bytes, bytearray)):
+        return (ring + ring).find(ring, 1)
+    elif isinstance(ring, MappedRing):
+        return __shifted_period_length(
+            ring, ring.records, ring.record_size // ring.records.itemsize, ring.is_comparable_in_place
+        )
+    elif __is_binary(ring):
+        view: memoryview = memoryview(ring)
+        return __shifted_period_length(view, view, 1, __is_comparable_in_place(view))
+    shortest: int = length - __prefix_table(ring)[-1]
+    if length % shortest == 0:
+        return shortest
+    else:
+        return length
+
+
+def primitive_period(ring: Seq) -> Seq:
+    """Finds the shortest sequence that repeated gives this circular sequence.
+
+    Examples:
+      >>> primitive_period('-|--|--|--|-')
+      '-|-'
+      >>> primitive_period('ABCAB')
+      'ABCAB'
+
+    Notes:
+      Runs in linear time, without computing any rotation.
+
+    Args:
+      ring: a sequence
+
+    Returns:
+      The repeating unit, whose length times the rotational symmetry order is the sequence length
+    """
+    if len(ring) == 0:
+        return ring
+    else:
+        return ring[:__period_length(ring)]
+
+
+@cached
 def rotational_symmetry(ring: Seq) -> int:
     """Computes the order of rotational symmetry possessed by this circular sequence.
 
@@ -436,6 +1318,9 @@ def rotational_symmetry(ring: Seq) -> int:
       >>> rotational_symmetry('-|+-|+-|+-|+')
       4
 
+    Notes:
+      Runs in linear time, without computing any rotation.
+
     Args:
       ring: a sequence
 
@@ -447,38 +1332,20 @@ def rotational_symmetry(ring: Seq) -> int:
     if length < 2:
         return 1
     else:
-        divisors_in_decreasing_size: range = range(int(length / 2), 2, -1)
-        exact_divisors: Iterator[int] = filter(lambda divisor: length % divisor == 0, divisors_in_decreasing_size)
-        folds_in_decreasing_size: Iterator[int] = iter([length] + list(exact_divisors))
-        symmetric_folds: Iterator[int] = filter(lambda fs: __are_folds_symmetrical(ring, fs), folds_in_decreasing_size)
-        return next(symmetric_folds, 1)
-
-
-def __greater_half_range(ring: Seq) -> range:
-    return range(0, int(ceil(len(ring) / 2)))
-
-
-def __check_reflection_axis(ring: Seq, gap: int) -> bool:
-    return all(map(lambda j: apply_o(ring, j + 1) == apply_o(ring, -(j + gap)), __greater_half_range(ring)))
-
-
-def __has_head_on_axis(ring: Seq) -> bool:
-    return __check_reflection_axis(ring, 1)
+        return length // __period_length(ring)
 
 
-def __has_axis_between_head_and_next(ring: Seq) -> bool:
-    return __check_reflection_axis(ring, 0)
-
-
-def __has_axis(ring: Seq) -> bool:
-    return __has_head_on_axis(ring) or __has_axis_between_head_and_next(ring)
-
-
-def __find_reflection_symmetry(ring: Seq) -> Optional[Index]:
-    filtered_indices: Iterator[Index] = filter(lambda j: __has_axis(start_at(ring, j)), __greater_half_range(ring))
-    return next(filtered_indices, None)
+def __reflection_axis(ring: Seq) -> Optional[Index]:
+    # for a ring with no rotational symmetry, the index of the element close to its only axis, if any
+    length: int = len(ring)
+    maybe_offset: Optional[Index] = __rotation_offset(__typed_reverse(ring), ring)
+    if maybe_offset is None:
+        return None
+    else:
+        return (length - 1 - maybe_offset) // 2
 
 
+@cached
 def symmetry_indices(ring: Seq) -> list[Index]:
     """Finds the indices of each element of this circular sequence close to an axis of reflectional symmetry.
 
@@ -488,6 +1355,9 @@ def symmetry_indices(ring: Seq) -> list[Index]:
       >>> symmetry_indices('-|+-|+-|+-|+')
       []
 
+    Notes:
+      Runs in linear time, searching the repeating unit in its own reversion walked twice.
+
     Args:
       ring: a sequence
 
@@ -499,15 +1369,15 @@ def symmetry_indices(ring: Seq) -> list[Index]:
     if length == 0:
         return []
     else:
-        folds: int = rotational_symmetry(ring)
-        fold_size: int = int(length / folds)
-        maybe_symmetry: Optional[Index] = __find_reflection_symmetry(ring[:fold_size])
+        fold_size: int = __period_length(ring)
+        maybe_symmetry: Optional[Index] = __reflection_axis(ring[:fold_size])
         if maybe_symmetry is None:
             return []
         else:
-            return list(map(lambda j: j * fold_size + maybe_symmetry, range(folds)))
+            return list(map(lambda j: j * fold_size + maybe_symmetry, range(length // fold_size)))
 
 
+@cached
 def symmetry(ring: Seq) -> int:
     """Computes the order of reflectional (mirror) symmetry possessed by this circular sequence.
 
@@ -519,6 +1389,7 @@ def symmetry(ring: Seq) -> int:
 
     Notes:
       Reflectional symmetry is always lower or equal than rotational symmetry.
+      Runs in linear time.
 
     Args:
       ring: a sequence
@@ -528,3 +1399,273 @@ def symmetry(ring: Seq) -> int:
       in which a circular sequence looks exactly the same
     """
     return len(symmetry_indices(ring))
+
+
+def __least_rotation_index(ring: Seq) -> Index:
+    length: int = len(ring)
+    i: Index = 0
+    j: Index = 1
+    k: int = 0
+    while i < length and j < length and k < length:
+        a: Any = ring[(i + k) % length]
+        b: Any = ring[(j + k) % length]
+        if a == b:
+            k += 1
+            continue
+        if a > b:
+            i += k + 1
+        else:
+            j += k + 1
+        if i == j:
+            j += 1
+        k = 0
+    return min(i, j)
+
+
+def __array_least_rotation_index(ring: Seq) -> Index:
+    # shrinks column by column the candidate starts, keeping those with the smallest element,
+    # and dropping those starting within the prefix already compared of a previous candidate
+    length: int = len(ring)
+    ranks: numpy.ndarray = ring if ring.dtype.kind in "biuf" else numpy.unique(ring, return_inverse=True)[1]
+    twice: numpy.ndarray = numpy.concatenate((ranks, ranks))
+    candidates: numpy.ndarray = numpy.arange(length)
+    k: int = 0
+    while len(candidates) > 1 and k < length:
+        column: numpy.ndarray = twice[candidates + k]
+        candidates = candidates[column == column.min()]
+        k += 1
+        candidates = candidates[numpy.concatenate(([True], numpy.diff(candidates) > k))]
+    return int(candidates[0])
+
+
+@cached
+def canonical_index(ring: Seq) -> Index:
+    """Finds the index where the lexicographically smallest rotation of this circular sequence starts.
+
+    Examples:
+      >>> canonical_index('CAB')
+      1
+      >>> canonical_index('ABAB')
+      0
+
+    Notes:
+      Runs in linear time, without computing any rotation.
+      A NumPy array is not copied into a list, its candidate starts are narrowed column by column
+      in O(n log n) vectorized steps.
+      If more rotations are equal, the smallest index is returned.
+
+    Args:
+      ring: a sequence
+
+    Returns:
+      A standard index, 0 if the sequence is empty
+    """
+    if len(ring) == 0:
+        return 0
+    elif __is_array(ring):
+        return __array_least_rotation_index(ring)
+    else:
+        return __least_rotation_index(ring)
+
+
+def canonical_rotation(ring: Seq) -> Seq:
+    """Computes the lexicographically smallest rotation of this circular sequence.
+
+    Examples:
+      >>> canonical_rotation('CAB')
+      'ABC'
+      >>> canonical_rotation([2, 1, 3, 1])
+      [1, 2, 1, 3]
+
+    Notes:
+      Is equivalent to `min(rotations(ring))`, but in linear time.
+      Two sequences are rotations of each other if and only if their canonical rotations are equal.
+
+    Args:
+      ring: a sequence
+
+    Returns:
+      The rotated sequence, starting at `canonical_index`
+    """
+    if len(ring) == 0:
+        return ring
+    else:
+        return start_at(ring, canonical_index(ring))
+
+
+def __lexicographic_min(ring: Seq, that: Seq) -> Seq:
+    if __is_array(ring):
+        different: numpy.ndarray = numpy.flatnonzero(ring != that)
+        return that if different.size > 0 and that[different[0]] < ring[different[0]] else ring
+    elif isinstance(ring, memoryview):  # not ordered
+        maybe_different: Optional[Index] = next(filter(lambda j: ring[j] != that[j], range(len(ring))), None)
+        return that if maybe_different is not None and that[maybe_different] < ring[maybe_different] else ring
+    else:
+        return min(ring, that)
+
+
+def canonical_bracelet(ring: Seq) -> Seq:
+    """Computes the lexicographically smallest rotation or reflection of this circular sequence.
+
+    Examples:
+      >>> canonical_bracelet('CBA')
+      'ABC'
+      >>> canonical_bracelet([1, 3, 2, 2])
+      [1, 2, 2, 3]
+
+    Notes:
+      Is equivalent to `min(rotations_and_reflections(ring))`, but in linear time.
+      Two sequences are rotations and/or reflections of each other if and only if their canonical bracelets are equal.
+
+    Args:
+      ring: a sequence
+
+    Returns:
+      The rotated, and possibly reflected, sequence
+    """
+    if len(ring) == 0:
+        return ring
+    else:
+        return __lexicographic_min(canonical_rotation(ring), canonical_rotation(__typed_reverse(ring)))
+
+
+class NecklaceKey:
+    """A hashable key of a circular sequence, equal for all the sequences that are rotations of each other.
+
+    Examples:
+      >>> NecklaceKey('CAB') == NecklaceKey('BCA')
+      True
+      >>> len({NecklaceKey([1, 2, 3]), NecklaceKey([2, 3, 1]), NecklaceKey([3, 2, 1])})
+      2
+
+    Notes:
+      Builds in linear time, computing the canonical form once,
+      then hashes in constant time, as any key in a `dict` or `set`.
+      Sequences of different kinds, for example `list` and `tuple`, never give equal keys.
+
+    Attributes:
+        underlying: The wrapped sequence.
+        canonical: The canonical form of the wrapped sequence.
+    """
+    __slots__ = ("underlying", "canonical", "__value", "__hash")
+
+    def __init__(self, underlying: Seq):
+        """Initializes the key with the sequence, computing its canonical form."""
+        self.underlying = underlying
+        self.canonical = self.canonical_of(underlying)
+        if isinstance(self.canonical, (str, tuple, bytes)):
+            hashable: str | tuple | bytes = self.canonical
+        elif isinstance(self.canonical, bytearray):
+            hashable = bytes(self.canonical)
+        elif isinstance(self.canonical, list):
+            hashable = tuple(self.canonical)
+        elif hasattr(self.canonical, "tolist"):
+            hashable = tuple(self.canonical.tolist())
+        else:  # as an empty `RingBuffer` or `MappedRing`, returned unchanged
+            hashable = tuple(self.canonical)
+        self.__value = (type(underlying[:0]), hashable)
+        self.__hash = hash((type(self), self.__value))
+
+    @staticmethod
+    def canonical_of(ring: Seq) -> Seq:
+        """Computes the canonical form shared by all the equivalent sequences, here `canonical_rotation`."""
+        return canonical_rotation(ring)
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, NecklaceKey):
+            return type(self) is type(other) and self.__hash == other.__hash and self.__value == other.__value
+        else:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.underlying!r})"
+
+
+class BraceletKey(NecklaceKey):
+    """A hashable key of a circular sequence, equal for all the sequences that are rotations and/or reflections
+    of each other.
+
+    Examples:
+      >>> BraceletKey('ABC') == BraceletKey('BAC')
+      True
+      >>> len({BraceletKey([1, 2, 3]), BraceletKey([2, 3, 1]), BraceletKey([3, 2, 1])})
+      1
+
+    Notes:
+      Builds in linear time, computing the canonical form once,
+      then hashes in constant time, as any key in a `dict` or `set`.
+      Sequences of different kinds, for example `list` and `tuple`, never give equal keys.
+
+    Attributes:
+        underlying: The wrapped sequence.
+        canonical: The canonical form of the wrapped sequence.
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def canonical_of(ring: Seq) -> Seq:
+        """Computes the canonical form shared by all the equivalent sequences, here `canonical_bracelet`."""
+        return canonical_bracelet(ring)
+
+
+def __group_by(key: Callable[[Seq], NecklaceKey], rings: Iterable[Seq], counts: bool) -> list[tuple[Seq, Any]]:
+    if counts:
+        sizes: dict[NecklaceKey, int] = {}
+        for ring in rings:
+            ring_key: NecklaceKey = key(ring)
+            sizes[ring_key] = sizes.get(ring_key, 0) + 1
+        return list(map(lambda item: (item[0].canonical, item[1]), sizes.items()))
+    else:
+        members: dict[NecklaceKey, list[Seq]] = {}
+        for ring in rings:
+            members.setdefault(key(ring), []).append(ring)
+        return list(map(lambda item: (item[0].canonical, item[1]), members.items()))
+
+
+def group_by_rotation(rings: Iterable[Seq], counts: bool = False) -> list[tuple[Seq, Any]]:
+    """Partitions circular sequences into classes of sequences that are rotations of each other.
+
+    Examples:
+      >>> group_by_rotation(['BCA', 'ACB', 'ABC'])
+      [('ABC', ['BCA', 'ABC']), ('ACB', ['ACB'])]
+      >>> group_by_rotation(['BCA', 'ACB', 'ABC'], counts=True)
+      [('ABC', 2), ('ACB', 1)]
+
+    Notes:
+      Runs in expected linear time on the total length, indexing each sequence by its `NecklaceKey`.
+      Classes are listed in order of first appearance.
+
+    Args:
+      rings: sequences, also a single-use iterator
+      counts: if True, counts the members of each class instead of listing them
+
+    Returns:
+      For each class, a pair of its `canonical_rotation` and the list, or the number, of its members
+    """
+    return __group_by(NecklaceKey, rings, counts)
+
+
+def group_by_dihedral(rings: Iterable[Seq], counts: bool = False) -> list[tuple[Seq, Any]]:
+    """Partitions circular sequences into classes of sequences that are rotations and/or reflections of each other.
+
+    Examples:
+      >>> group_by_dihedral(['BCA', 'ACB', 'ABD'])
+      [('ABC', ['BCA', 'ACB']), ('ABD', ['ABD'])]
+      >>> group_by_dihedral(['BCA', 'ACB', 'ABD'], counts=True)
+      [('ABC', 2), ('ABD', 1)]
+
+    Notes:
+      Runs in expected linear time on the total length, indexing each sequence by its `BraceletKey`.
+      Classes are listed in order of first appearance.
+
+    Args:
+      rings: sequences, also a single-use iterator
+      counts: if True, counts the members of each class instead of listing them
+
+    Returns:
+      For each class, a pair of its `canonical_bracelet` and the list, or the number, of its members
+    """
+    return __group_by(BraceletKey, rings, counts)
@@ -0,0 +1,185 @@
+"""Contains the parallel methods, spreading large collections of circular sequences across processes.
+
+Each method takes many sequences and splits them in chunks,
+processed by a pool of worker processes.
+A two-dimensional `numpy.ndarray`, one sequence per row,
+is handed to the workers through shared memory, without pickling the rows,
+and processed with the batch methods.
+
+Typical usage example:
+  >>> map_symmetry(['-|--|--|--|-', 'ABA', 'ABC'], max_workers=2)
+  [4, 1, 0]
+"""
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice, repeat
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from ring_seq import methods
+from ring_seq.methods import BraceletKey, Seq, canonical_bracelet, canonical_rotation, symmetry
+
+try:
+    import numpy
+    from ring_seq.batch import canonical_bracelet_batch, canonical_rotation_batch, symmetry_batch
+except ImportError:  # NumPy is an optional dependency
+    numpy = None
+
+
+def __is_shareable(rings: Any) -> bool:
+    return numpy is not None and isinstance(rings, numpy.ndarray) and rings.ndim == 2 and not rings.dtype.hasobject
+
+
+def __chunks(rings: Iterable[Seq], chunksize: int) -> Iterator[list[Seq]]:
+    iterator: Iterator[Seq] = iter(rings)
+    while chunk := list(islice(iterator, chunksize)):
+        yield chunk
+
+
+def __batch_chunk(f: Callable, source: tuple, target: tuple, start: int, stop: int) -> None:
+    # runs in a worker, reading rows from the source shared memory and writing results to the target one
+    source_memory: SharedMemory = SharedMemory(name=source[0])
+    target_memory: SharedMemory = SharedMemory(name=target[0])
+    try:
+        rows: numpy.ndarray = numpy.ndarray(source[1], dtype=source[2], buffer=source_memory.buf)
+        results: numpy.ndarray = numpy.ndarray(target[1], dtype=target[2], buffer=target_memory.buf)
+        results[start:stop] = f(rows[start:stop])
+        del rows, results
+    finally:
+        source_memory.close()
+        target_memory.close()
+
+
+def __map_batch(f: Callable, rows: "numpy.ndarray", shape: tuple, dtype: Any, max_workers: Optional[int],
+                chunksize: int) -> "numpy.ndarray":
+    source_memory: SharedMemory = SharedMemory(create=True, size=max(rows.nbytes, 1))
+    target_size: int = numpy.dtype(dtype).itemsize * int(numpy.prod(shape))
+    target_memory: SharedMemory = SharedMemory(create=True, size=max(target_size, 1))
+    try:
+        shared: numpy.ndarray = numpy.ndarray(rows.shape, dtype=rows.dtype, buffer=source_memory.buf)
+        shared[:] = rows
+        del shared
+        source: tuple = (source_memory.name, rows.shape, rows.dtype)
+        target: tuple = (target_memory.name, shape, dtype)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures: list[Future] = list(map(
+                lambda start: executor.submit(__batch_chunk, f, source, target, start, start + chunksize),
+                range(0, rows.shape[0], chunksize)
+            ))
+            for future in futures:
+                future.result()
+        return numpy.ndarray(shape, dtype=dtype, buffer=target_memory.buf).copy()
+    finally:
+        source_memory.close()
+        source_memory.unlink()
+        target_memory.close()
+        target_memory.unlink()
+
+
+def __group_rows(rows: "numpy.ndarray", canonicals: "numpy.ndarray", counts: bool) -> list[tuple[Seq, Any]]:
+    # the rows grouped by their canonical form, compared by its bytes, in order of first occurrence
+    groups: dict[bytes, list] = {}
+    for row, canonical in zip(rows, canonicals):
+        key: bytes = canonical.tobytes()
+        if key in groups:
+            groups[key][1].append(row)
+        else:
+            groups[key] = [canonical, [row]]
+    return list(map(lambda group: (group[0], len(group[1]) if counts else group[1]), groups.values()))
+
+
+def map_symmetry(rings: Iterable[Seq], max_workers: Optional[int] = None, chunksize: int = 1024) -> Any:
+    """Computes in parallel the order of reflectional (mirror) symmetry of each circular sequence.
+
+    Examples:
+      >>> map_symmetry([(1, 2, 1, 2), (1, 2, 3, 4)], max_workers=2)
+      [2, 0]
+
+    Notes:
+      Gives the same results as `symmetry` mapped on the sequences.
+
+    Args:
+      rings: sequences, or a two-dimensional `numpy.ndarray` with one sequence per row
+      max_workers: the number of worker processes, by default as many as the processors
+      chunksize: the number of sequences sent to a worker at a time
+
+    Returns:
+      A list of symmetry orders, or a `numpy.ndarray` if the sequences are given as a two-dimensional array
+    """
+    if __is_shareable(rings):
+        return __map_batch(symmetry_batch, rings, rings.shape[:1], numpy.intp, max_workers, chunksize)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(symmetry, rings, chunksize=chunksize))
+
+
+def map_canonical(rings: Iterable[Seq], bracelet: bool = False, max_workers: Optional[int] = None,
+                  chunksize: int = 1024) -> Any:
+    """Computes in parallel the canonical form of each circular sequence.
+
+    Examples:
+      >>> map_canonical(['CAB', 'BBA'], max_workers=2)
+      ['ABC', 'ABB']
+      >>> map_canonical(['CBA', 'BBA'], bracelet=True, max_workers=2)
+      ['ABC', 'ABB']
+
+    Notes:
+      Gives the same results as `canonical_rotation`, or `canonical_bracelet`, mapped on the sequences.
+
+    Args:
+      rings: sequences, or a two-dimensional `numpy.ndarray` with one sequence per row
+      bracelet: if True, computes the `canonical_bracelet` instead of the `canonical_rotation`
+      max_workers: the number of worker processes, by default as many as the processors
+      chunksize: the number of sequences sent to a worker at a time
+
+    Returns:
+      A list of canonical forms, or a `numpy.ndarray` if the sequences are given as a two-dimensional array
+    """
+    if __is_shareable(rings):
+        batch: Callable = canonical_bracelet_batch if bracelet else canonical_rotation_batch
+        return __map_batch(batch, rings, rings.shape, rings.dtype, max_workers, chunksize)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        f: Callable[[Seq], Seq] = canonical_bracelet if bracelet else canonical_rotation
+        return list(executor.map(f, rings, chunksize=chunksize))
+
+
+def group_by_dihedral(rings: Iterable[Seq], counts: bool = False, max_workers: Optional[int] = None,
+                      chunksize: int = 1024) -> list[tuple[Seq, Any]]:
+    """Partitions in parallel circular sequences into classes of sequences that are rotations and/or reflections
+    of each other.
+
+    Examples:
+      >>> group_by_dihedral(['BCA', 'ACB', 'ABD'], max_workers=2, chunksize=2)
+      [('ABC', ['BCA', 'ACB']), ('ABD', ['ABD'])]
+
+    Notes:
+      Gives the same results as `ring_seq.methods.group_by_dihedral`.
+      Each chunk is grouped by a worker, the parent process merges only the classes of each chunk.
+      The rows of a two-dimensional `numpy.ndarray` are instead canonized by the workers through shared memory,
+      and grouped by the parent process.
+
+    Args:
+      rings: sequences, also a single-use iterator, or a two-dimensional `numpy.ndarray` with one sequence per row
+      counts: if True, counts the members of each class instead of listing them
+      max_workers: the number of worker processes, by default as many as the processors
+      chunksize: the number of sequences sent to a worker at a time
+
+    Returns:
+      For each class, a pair of its `canonical_bracelet` and the list, or the number, of its members
+    """
+    if __is_shareable(rings):
+        canonicals: numpy.ndarray = __map_batch(
+            canonical_bracelet_batch, rings, rings.shape, rings.dtype, max_workers, chunksize
+        )
+        return __group_rows(rings, canonicals, counts)
+    merged: dict[BraceletKey, Any] = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        groups: Iterator[list[tuple[Seq, Any]]] = executor.map(
+            methods.group_by_dihedral, __chunks(rings, chunksize), repeat(counts)
+        )
+        for group in groups:
+            for canonical, members in group:
+                key: BraceletKey = BraceletKey(canonical)
+                if key in merged:
+                    merged[key] += members
+                else:
+                    merged[key] = members
+    return list(map(lambda item: (item[0].canonical, item[1]), merged.items()))
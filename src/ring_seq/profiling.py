@@ -0,0 +1,217 @@
+"""Contains an opt-in instrumentation of the library methods.
+
+Inside a `track()` block, each call to a method of `ring_seq.methods`, also via `RingSeq`, is timed,
+and the work it does, including in the other methods it uses, is counted:
+the sequences copied, the elements allocated by the copies,
+and the elements examined by comparisons and searches.
+The calls are observed with a profiling hook installed only while a block runs,
+outside the methods run untouched.
+
+Typical usage example:
+  >>> from ring_seq.methods import reflect_at, is_rotation_of
+  >>> with track() as tracker:
+  ...     is_rotation_of(reflect_at('ABCDE', 2), 'ABCDE')
+  False
+  >>> sorted(tracker.functions)
+  ['is_rotation_of', 'reflect_at']
+  >>> tracker.functions['is_rotation_of'].comparisons
+  10
+"""
+import sys
+import threading
+from contextlib import contextmanager
+from inspect import unwrap
+from threading import Lock, local
+from time import perf_counter
+from types import CodeType, FrameType
+from typing import Any, Callable, Iterator, Optional
+
+from ring_seq import methods
+
+
+class FunctionStats:
+    """Counters of the calls to a single method.
+
+    Attributes:
+        calls: The calls, made directly and not by another tracked method.
+        seconds: The wall time spent in the calls, also iterating their results if lazy.
+        copies: The sequences copied.
+        allocated: The elements of the sequences copied.
+        comparisons: The elements examined by comparisons and searches,
+            each element of a compared sequence or of a search window counted once.
+    """
+    __slots__ = ("calls", "seconds", "copies", "allocated", "comparisons")
+
+    def __init__(self):
+        """Initializes all the counters to zero."""
+        self.calls = 0
+        self.seconds = 0.0
+        self.copies = 0
+        self.allocated = 0
+        self.comparisons = 0
+
+    def __repr__(self) -> str:
+        return (f"FunctionStats(calls={self.calls}, seconds={self.seconds:.6f}, copies={self.copies}, "
+                f"allocated={self.allocated}, comparisons={self.comparisons})")
+
+
+class Tracker:
+    """The counters collected inside a `track()` block, for each method called.
+
+    Attributes:
+        functions: The counters of each method, by name.
+    """
+    __slots__ = ("functions",)
+
+    def __init__(self):
+        """Initializes the tracker with no method called."""
+        self.functions: dict[str, FunctionStats] = {}
+
+    def stats(self, name: str) -> FunctionStats:
+        """Gives the counters of a method, creating them if not called yet."""
+        if name not in self.functions:
+            self.functions[name] = FunctionStats()
+        return self.functions[name]
+
+    def total(self) -> FunctionStats:
+        """Sums the counters of all the methods called."""
+        total: FunctionStats = FunctionStats()
+        for stats in self.functions.values():
+            for counter in FunctionStats.__slots__:
+                setattr(total, counter, getattr(total, counter) + getattr(stats, counter))
+        return total
+
+    def report(self) -> str:
+        """Formats the counters as a table, the slowest methods first."""
+        lines: list[str] = [
+            f"{'function':40} {'calls':>10} {'seconds':>12} {'copies':>10} {'allocated':>12} {'comparisons':>12}"
+        ]
+        for name, stats in sorted(self.functions.items(), key=lambda item: -item[1].seconds):
+            lines.append(f"{name:40} {stats.calls:>10} {stats.seconds:>12.6f} {stats.copies:>10} "
+                         f"{stats.allocated:>12} {stats.comparisons:>12}")
+        return "\n".join(lines)
+
+
+def __length(sequence: Optional[Any]) -> int:
+    return 0 if sequence is None else len(sequence)  # no sequence if an error was raised
+
+
+def __is_view(sequence: Optional[Any]) -> bool:
+    return isinstance(sequence, memoryview) or getattr(sequence, "base", None) is not None
+
+
+# for each helper building or comparing sequences, the elements it copies and those it examines,
+# given its result and arguments
+__WORK: dict[str, Callable[..., tuple[int, int]]] = {
+    "__dihedral_copy": lambda result, ring, head, is_reflected: (
+        0 if isinstance(ring, memoryview) else __length(result), 0  # counted by __typed_concat
+    ),
+    "__typed_assemble": lambda result, t, iterator: (__length(result), 0),
+    "__typed_concat": lambda result, ring, pieces: (0 if isinstance(ring, (list, tuple)) else __length(result), 0),
+    "__typed_reverse": lambda result, ring: (0 if __is_view(result) else __length(result), 0),
+    "__are_equal": lambda result, ring, that: (0, len(ring)),
+    "__is_reflection_at_head": lambda result, ring, that: (0, len(ring)),
+    "__rotation_offset": lambda result, ring, that: (2 * len(ring),) * 2 if isinstance(ring, (str, bytes, bytearray))
+    else (0, 0),
+    "__period_length": lambda result, ring: (2 * len(ring),) * 2 if isinstance(ring, (bytes, bytearray)) else (0, 0),
+    "__shifted_period_length": lambda result, ring, records, width, is_comparable_in_place: (0, len(ring)),
+    "__are_rotations_equal": lambda result, ring, head, that, that_head: (0, len(ring)),
+    "__matches_o": lambda result, ring, pattern, start, size: (0, size),
+    "__find_str_o": lambda result, ring, x, start, size: (0, size),
+    "__find_element_o": lambda result, ring, x, start, size: (0, size),
+    "__is_repeated_at": lambda result, ring, that, i: (0, len(that)),
+    "__prefix_table": lambda result, pattern: (0, len(pattern)),
+    "__least_rotation_index": lambda result, ring: (0, 2 * len(ring)),
+    "__lexicographic_min": lambda result, ring, that: (0, len(ring))
+}
+
+__trackers: list[Tracker] = []
+__lock: Lock = Lock()
+__calls: local = local()  # the outermost tracked call running in each thread, if any
+__hooks: dict[str, Any] = {}
+
+
+def __add(name: str, counter: str, amount: float) -> None:
+    for tracker in __trackers:
+        stats: FunctionStats = tracker.stats(name)
+        setattr(stats, counter, getattr(stats, counter) + amount)
+
+
+def __codes() -> tuple[dict[CodeType, str], dict[CodeType, Callable[..., tuple[int, int]]]]:
+    # the code of each public method, by name, and of each helper building or comparing sequences
+    entries: dict[CodeType, str] = {}
+    helpers: dict[CodeType, Callable[..., tuple[int, int]]] = {}
+    for name, f in vars(methods).items():
+        if callable(f) and not isinstance(f, type) and getattr(f, "__module__", None) == methods.__name__:
+            code: CodeType = unwrap(f).__code__
+            if name in __WORK:
+                helpers[code] = __WORK[name]
+            if not name.startswith("_"):
+                entries[code] = name
+    return entries, helpers
+
+
+def __hook(entries: dict[CodeType, str], helpers: dict[CodeType, Callable[..., tuple[int, int]]]) -> Callable:
+    def profile(frame: FrameType, event: str, arg: Any) -> None:
+        if event == "call":
+            if frame.f_code in entries and getattr(__calls, "frame", None) is None:
+                __calls.frame = frame
+                __calls.name = entries[frame.f_code]
+                __calls.start = perf_counter()
+        elif event == "return":
+            code: CodeType = frame.f_code
+            running: Optional[str] = getattr(__calls, "name", None)
+            if code in helpers:
+                arguments: list = [frame.f_locals[name] for name in code.co_varnames[:code.co_argcount]]
+                allocated, examined = helpers[code](arg, *arguments)
+                if allocated > 0:
+                    __add(running or "(untracked)", "copies", 1)
+                    __add(running or "(untracked)", "allocated", allocated)
+                if examined > 0:
+                    __add(running or "(untracked)", "comparisons", examined)
+            if frame is getattr(__calls, "frame", None):
+                __add(running, "seconds", perf_counter() - __calls.start)
+                __add(running, "calls", 1)
+                __calls.frame = None
+                __calls.name = None
+
+    return profile
+
+
+@contextmanager
+def track() -> Iterator[Tracker]:
+    """Tracks the calls to the library methods made inside the block.
+
+    Examples:
+      >>> from ring_seq.methods import symmetry
+      >>> with track() as tracker:
+      ...     var = symmetry((1, 2, 1, 2))
+      >>> tracker.functions['symmetry'].calls
+      1
+
+    Notes:
+      A call made by another method is not counted as a call, its time and work are counted in the outermost one,
+      while the work done iterating a lazy result is counted in the methods called to compute each element.
+      Only the calls made by the thread entering the block, and by the threads it starts, are tracked,
+      not those run in other processes, as with `ring_seq.parallel`, or answered by `ring_seq.cache`.
+      Any other profiler of the same threads is suspended while the block runs.
+
+    Returns:
+      The tracker, filled while the block runs
+    """
+    tracker: Tracker = Tracker()
+    with __lock:
+        if not __trackers:
+            __hooks["previous"] = sys.getprofile()
+            __hooks["profile"] = __hook(*__codes())
+            threading.setprofile(__hooks["profile"])
+        __trackers.append(tracker)
+    sys.setprofile(__hooks["profile"])
+    try:
+        yield tracker
+    finally:
+        with __lock:
+            __trackers.remove(tracker)
+            if not __trackers:
+                sys.setprofile(__hooks["previous"])
+                threading.setprofile(None)
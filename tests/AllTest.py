@@ -3,9 +3,19 @@ import unittest
 from tests.IndexingTest import IndexingOps
 from tests.SlicingTest import SlicingOps
 from tests.TransformingTest import TransformingOps
+from tests.ViewingTest import ViewingOps
 from tests.IteratingTest import IteratingOps
 from tests.ComparingTest import ComparingOps
 from tests.SymmetryTest import SymmetryOps
+from tests.CanonicalTest import CanonicalOps
+from tests.NumpyTest import NumpyOps
+from tests.BinaryTest import BinaryOps
+from tests.MappedTest import MappedOps
+from tests.BufferTest import BufferOps
+from tests.BatchTest import BatchOps
+from tests.CacheTest import CacheOps
+from tests.ParallelTest import ParallelOps
+from tests.ProfilingTest import ProfilingOps
 from tests.RingSeqTest import RingSeqOps
 from tests.examples.RingTest import RingOps
 
@@ -13,7 +23,9 @@ from tests.examples.RingTest import RingOps
 class RingTestSuite(unittest.TestSuite):
     def test_all(self):
         self.addTests(iter(
-            (IndexingOps, SlicingOps, TransformingOps, IteratingOps, ComparingOps, SymmetryOps, RingOps, RingSeqOps)
+            (IndexingOps, SlicingOps, TransformingOps, ViewingOps, IteratingOps, ComparingOps, SymmetryOps, CanonicalOps,
+             NumpyOps, BinaryOps, MappedOps, BufferOps, BatchOps, CacheOps, ParallelOps, ProfilingOps, RingOps,
+             RingSeqOps)
         ))
 
 
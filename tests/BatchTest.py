@@ -0,0 +1,70 @@
+import unittest
+
+from ring_seq.methods import canonical_bracelet, canonical_rotation, is_rotation_of, rotational_symmetry, symmetry
+
+try:
+    import numpy
+    from ring_seq.batch import canonical_bracelet_batch, canonical_rotation_batch, is_rotation_of_batch, \
+        rotational_symmetry_batch, symmetry_batch
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class BatchOps(unittest.TestCase):
+
+    def setUp(self):
+        self.rings = numpy.array([
+            [2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2],
+            [2, 1, 3, 2, 1, 3, 2, 1, 3, 2, 1, 3],
+            [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
+            [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            [3, 1, 1, 2, 1, 1, 3, 1, 1, 2, 1, 1]
+        ])
+        self.rows = self.rings.tolist()
+
+    def test_canonical_rotation_batch(self):
+        self.assertEqual(canonical_rotation_batch(self.rings).tolist(), list(map(canonical_rotation, self.rows)))
+
+    def test_canonical_rotation_batch_str(self):
+        result: list = canonical_rotation_batch(numpy.array([list("CAB"), list("BAB")])).tolist()
+        self.assertEqual(result, [list("ABC"), list("ABB")])
+
+    def test_canonical_bracelet_batch(self):
+        self.assertEqual(canonical_bracelet_batch(self.rings).tolist(), list(map(canonical_bracelet, self.rows)))
+        result: list = canonical_bracelet_batch(numpy.array([list("CBA"), list("BCA")])).tolist()
+        self.assertEqual(result, [list("ABC"), list("ABC")])
+        self.assertEqual(canonical_bracelet_batch(numpy.zeros((2, 0), dtype=int)).shape, (2, 0))
+
+    def test_is_rotation_of_batch(self):
+        self.assertEqual(is_rotation_of_batch(self.rings, self.rings[0]).tolist(), [True, False, False, False, False])
+        thats: numpy.ndarray = numpy.roll(self.rings, 5, axis=1)[:, ::-1]
+        self.assertEqual(
+            is_rotation_of_batch(self.rings, thats).tolist(),
+            list(map(is_rotation_of, self.rows, thats.tolist()))
+        )
+
+    def test_is_rotation_of_batch_different_length(self):
+        self.assertEqual(is_rotation_of_batch(self.rings, [1, 2, 3]).tolist(), [False] * 5)
+
+    def test_rotational_symmetry_batch(self):
+        self.assertEqual(rotational_symmetry_batch(self.rings).tolist(), [4, 4, 1, 12, 2])
+        self.assertEqual(rotational_symmetry_batch(self.rings).tolist(), list(map(rotational_symmetry, self.rows)))
+
+    def test_symmetry_batch(self):
+        self.assertEqual(symmetry_batch(self.rings).tolist(), [4, 0, 0, 12, 2])
+        self.assertEqual(symmetry_batch(self.rings).tolist(), list(map(symmetry, self.rows)))
+
+    def test_empty_batch(self):
+        empty: numpy.ndarray = numpy.zeros((3, 0), dtype=int)
+        self.assertEqual(rotational_symmetry_batch(empty).tolist(), [1, 1, 1])
+        self.assertEqual(symmetry_batch(empty).tolist(), [0, 0, 0])
+        self.assertEqual(canonical_rotation_batch(empty).shape, (3, 0))
+
+    def test_not_two_dimensional(self):
+        with self.assertRaises(ValueError):
+            var = symmetry_batch(numpy.array([1, 2, 1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from array import array
+
+from ring_seq.methods import BraceletKey, NecklaceKey, canonical_bracelet, canonical_rotation, find_all_o, index_o, \
+    index_of_slice_o, is_reflection_of, is_rotation_of, reflect_at, rotate_left, rotate_right, rotational_symmetry, \
+    rotations, slice_o, start_at, symmetry, symmetry_indices
+
+
+class BinaryOps(unittest.TestCase):
+
+    def setUp(self):
+        self.squaroid = b'-|--|--|--|-'
+
+    def test_bytes(self):
+        self.assertEqual(rotate_right(b'ABC', 1), b'CAB')
+        self.assertEqual(reflect_at(b'ABC', 1), b'BAC')
+        self.assertEqual(slice_o(b'ABC', -1, 4), b'CABCA')
+        self.assertEqual(index_o(b'ABC', ord('A'), 1), 0)
+        self.assertEqual(index_of_slice_o(b'ABC', b'CA'), 2)
+        self.assertEqual(list(find_all_o(self.squaroid, b'--')), [2, 5, 8, 11])
+        self.assertTrue(is_rotation_of(b'ABC', b'BCA'))
+        self.assertFalse(is_rotation_of(b'ABC', 'BCA'))
+        self.assertEqual(rotational_symmetry(self.squaroid), 4)
+        self.assertEqual(symmetry_indices(self.squaroid), [1, 4, 7, 10])
+        self.assertEqual(canonical_rotation(b'CAB'), b'ABC')
+
+    def test_bytearray(self):
+        ring: bytearray = bytearray(b'ABCD')
+        self.assertEqual(rotate_left(ring, 1), bytearray(b'BCDA'))
+        self.assertIsInstance(start_at(ring, 2), bytearray)
+        self.assertEqual(slice_o(ring, 3, 6), bytearray(b'DAB'))
+        self.assertEqual(index_of_slice_o(ring, b'DA'), 3)
+        self.assertTrue(is_reflection_of(ring, bytearray(b'ADCB')))
+        self.assertEqual(canonical_bracelet(bytearray(b'ADCB')), bytearray(b'ABCD'))
+        self.assertEqual(symmetry(bytearray(self.squaroid)), 4)
+
+    def test_memoryview(self):
+        ring: memoryview = memoryview(b'ABCD')
+        self.assertIsInstance(rotate_right(ring, 1), memoryview)
+        self.assertEqual(rotate_right(ring, 1).tobytes(), b'DABC')
+        self.assertEqual(reflect_at(ring).tobytes(), b'ADCB')
+        self.assertEqual(slice_o(ring, -1, 2).tobytes(), b'DAB')
+        self.assertEqual(index_o(ring, ord('D'), 1), 3)
+        with self.assertRaises(ValueError):
+            var = index_o(ring, ord('E'))
+        self.assertEqual(index_of_slice_o(ring, b'DA'), 3)
+        self.assertTrue(is_rotation_of(ring, memoryview(b'CDAB')))
+        self.assertEqual(symmetry_indices(memoryview(self.squaroid)), [1, 4, 7, 10])
+        self.assertEqual(canonical_rotation(memoryview(b'CDAB')).tobytes(), b'ABCD')
+        self.assertEqual(list(map(lambda r: r.tobytes(), rotations(memoryview(b'AB')))), [b'AB', b'BA'])
+
+    def test_memoryview_format(self):
+        ring: memoryview = memoryview(array('i', [3, 1, 2, 1, 2]))
+        self.assertEqual(rotate_left(ring, 1).format, 'i')
+        self.assertEqual(rotate_left(ring, 1).tolist(), [1, 2, 1, 2, 3])
+        self.assertEqual(slice_o(ring, 4, 7).tolist(), [2, 3, 1])
+        self.assertEqual(canonical_rotation(ring).tolist(), [1, 2, 1, 2, 3])
+        self.assertEqual(symmetry(array('i', [3, 1, 2, 2, 1])), 1)
+
+    def test_array(self):
+        ring: array = array('i', [1, 2, 3, 4])
+        self.assertEqual(rotate_right(ring, 1), array('i', [4, 1, 2, 3]))
+        self.assertEqual(reflect_at(ring, 1), array('i', [2, 1, 4, 3]))
+        self.assertEqual(slice_o(ring, -1, 2), array('i', [4, 1, 2]))
+        self.assertEqual(index_of_slice_o(ring, array('i', [4, 1])), 3)
+        self.assertTrue(is_rotation_of(ring, array('i', [3, 4, 1, 2])))
+        self.assertEqual(rotational_symmetry(array('d', [0.5, 1.5] * 3)), 3)
+        self.assertEqual(canonical_bracelet(array('i', [1, 4, 3, 2])), array('i', [1, 2, 3, 4]))
+
+    def test_in_place(self):
+        self.assertEqual(rotational_symmetry(b'ABC' * 1000), 1000)
+        self.assertEqual(rotational_symmetry(bytearray(b'ABC' * 1000 + b'A')), 1)
+        self.assertEqual(rotational_symmetry(memoryview(b'ABC' * 1000)), 1000)
+        self.assertEqual(rotational_symmetry(array('d', [0.0, 1.0, -0.0, 1.0])), 2)
+        self.assertEqual(rotational_symmetry(memoryview(bytes([1, 2, 1, 2])).cast('?')), 4)
+        self.assertTrue(is_rotation_of(memoryview(b'ABCABD'), memoryview(b'BDABCA')))
+        self.assertFalse(is_rotation_of(memoryview(b'ABCABD'), memoryview(b'BDACBA')))
+        self.assertTrue(is_rotation_of(array('d', [0.0, 1.0, 2.0]), array('d', [2.0, -0.0, 1.0])))
+        self.assertTrue(is_reflection_of(array('i', [1, 2, 3, 1]), array('i', [1, 1, 3, 2])))
+        self.assertEqual(symmetry_indices(memoryview(array('h', [1, 2, 1, 2]))), [0, 2])
+
+    def test_keys(self):
+        self.assertEqual(NecklaceKey(b'CAB'), NecklaceKey(b'BCA'))
+        self.assertEqual(NecklaceKey(bytearray(b'CAB')), NecklaceKey(bytearray(b'ABC')))
+        self.assertNotEqual(NecklaceKey(b'ABC'), NecklaceKey(bytearray(b'ABC')))
+        self.assertEqual(BraceletKey(memoryview(b'CBA')), BraceletKey(memoryview(b'ABC')))
+        self.assertEqual(len({NecklaceKey(array('i', [1, 2, 3])), NecklaceKey(array('i', [2, 3, 1]))}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
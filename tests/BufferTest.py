@@ -0,0 +1,90 @@
+import unittest
+
+from ring_seq.buffer import RingBuffer
+from ring_seq.methods import BraceletKey, NecklaceKey, canonical_rotation, group_by_rotation, index_o, \
+    index_of_slice_o, is_reflection_of, is_rotation_of, rotate_right, rotate_right_view, rotational_symmetry, slice_o, \
+    symmetry, symmetry_indices
+
+
+class BufferOps(unittest.TestCase):
+
+    def setUp(self):
+        self.buffer = RingBuffer(4, [1, 2, 3])
+
+    def test_creation(self):
+        self.assertEqual(len(self.buffer), 3)
+        self.assertEqual(list(self.buffer), [1, 2, 3])
+        self.assertFalse(self.buffer.is_full())
+        self.assertEqual(list(RingBuffer(2, 'ABC')), ['B', 'C'])
+        with self.assertRaises(ValueError):
+            var = RingBuffer(0)
+
+    def test_overwrite(self):
+        self.buffer.append(4)
+        self.assertTrue(self.buffer.is_full())
+        self.buffer.append(5)
+        self.assertEqual(list(self.buffer), [2, 3, 4, 5])
+        self.buffer.appendleft(0)
+        self.assertEqual(list(self.buffer), [0, 2, 3, 4])
+
+    def test_pop(self):
+        self.assertEqual(self.buffer.pop(), 3)
+        self.assertEqual(self.buffer.popleft(), 1)
+        self.assertEqual(list(self.buffer), [2])
+        self.buffer.clear()
+        with self.assertRaises(IndexError):
+            var = self.buffer.pop()
+
+    def test_rotation(self):
+        self.buffer.rotate_r(1)
+        self.assertEqual(list(self.buffer), [3, 1, 2])
+        self.buffer.rotate_l(4)
+        self.assertEqual(list(self.buffer), [1, 2, 3])
+        self.buffer.extend([4, 5])
+        self.buffer.rotate_r(-1)
+        self.assertEqual(list(self.buffer), [3, 4, 5, 2])
+
+    def test_indexing(self):
+        self.buffer.extend([4, 5])
+        self.assertEqual(self.buffer[0], 2)
+        self.assertEqual(self.buffer[-1], 5)
+        self.assertEqual(self.buffer[1:], [3, 4, 5])
+        self.assertEqual(self.buffer[::-2], [5, 3])
+        self.buffer[0] = 6
+        self.assertEqual(self.buffer.index(5), 3)
+        self.assertIn(6, self.buffer)
+        self.assertNotIn(2, self.buffer)
+        with self.assertRaises(IndexError):
+            var = self.buffer[4]
+
+    def test_equality(self):
+        self.assertEqual(self.buffer, RingBuffer(3, [1, 2, 3]))
+        self.assertNotEqual(self.buffer, [1, 2, 3])
+        with self.assertRaises(TypeError):
+            var = hash(self.buffer)
+
+    def test_methods(self):
+        window: RingBuffer = RingBuffer(6, [2, 1, 2, 2, 1, 2, 2])
+        self.assertEqual(list(window), [1, 2, 2, 1, 2, 2])
+        self.assertEqual(slice_o(window, -1, 2), [2, 1, 2])
+        self.assertEqual(rotate_right(window, 1), [2, 1, 2, 2, 1, 2])
+        self.assertEqual(list(rotate_right_view(window, 1)), [2, 1, 2, 2, 1, 2])
+        self.assertEqual(index_o(window, 1, 2), 3)
+        self.assertEqual(index_of_slice_o(window, [2, 1]), 2)
+        self.assertEqual(rotational_symmetry(window), 2)
+        self.assertEqual(symmetry_indices(window), [0, 3])
+        self.assertEqual(symmetry(window), 2)
+        self.assertEqual(canonical_rotation(window), [1, 2, 2, 1, 2, 2])
+        self.assertTrue(is_rotation_of(window, [2, 2, 1, 2, 2, 1]))
+        self.assertTrue(is_reflection_of(window, [1, 2, 2, 1, 2, 2]))
+
+    def test_empty(self):
+        empty: RingBuffer = RingBuffer(3)
+        self.assertEqual(list(empty), [])
+        self.assertEqual(NecklaceKey(empty), NecklaceKey(RingBuffer(2)))
+        self.assertEqual(BraceletKey(empty), BraceletKey(RingBuffer(2)))
+        self.assertEqual(group_by_rotation([RingBuffer(3, [1, 2]), empty], counts=True), [([1, 2], 1), (empty, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from ring_seq import cache
+from ring_seq.methods import canonical_bracelet, canonical_rotation, rotational_symmetry, symmetry, symmetry_indices
+
+
+class CacheOps(unittest.TestCase):
+
+    def setUp(self):
+        self.squaroid: tuple = (2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2)
+
+    def tearDown(self):
+        cache.disable()
+
+    def test_disabled_by_default(self):
+        self.assertEqual(rotational_symmetry(self.squaroid), 4)
+        self.assertEqual(cache.info(), cache.CacheInfo(0, 0, 0, 0))
+
+    def test_hits_and_misses(self):
+        cache.enable(maxsize=10)
+        self.assertEqual(rotational_symmetry(self.squaroid), 4)
+        self.assertEqual(rotational_symmetry(self.squaroid), 4)
+        self.assertEqual(rotational_symmetry(list(self.squaroid)), 4)
+        self.assertEqual(cache.info(), cache.CacheInfo(1, 1, 10, 1))
+
+    def test_same_results(self):
+        cache.enable()
+        for _ in range(2):
+            self.assertEqual(symmetry_indices(self.squaroid), [1, 4, 7, 10])
+            self.assertEqual(symmetry(self.squaroid), 4)
+            self.assertEqual(canonical_rotation("CDEAB"), "ABCDE")
+            self.assertEqual(canonical_bracelet("CBAED"), "ABCDE")
+
+    def test_kinds_are_kept_apart(self):
+        cache.enable()
+        self.assertEqual(canonical_rotation(("B", "A")), ("A", "B"))
+        self.assertEqual(canonical_rotation("BA"), "AB")
+
+    def test_equal_tuples_keep_their_elements(self):
+        cache.enable()
+        self.assertEqual(canonical_rotation((2, 1)), (1, 2))
+        self.assertEqual(canonical_rotation((2.0, 1.0)), (1.0, 2.0))
+        self.assertIsInstance(canonical_rotation((2.0, 1.0))[0], float)
+        self.assertEqual(list(map(type, canonical_bracelet((1, 0, 0)))), [int] * 3)
+        self.assertEqual(list(map(type, canonical_bracelet((True, False, False)))), [bool] * 3)
+        self.assertEqual(cache.info().hits, 4)
+
+    def test_returned_lists_are_copies(self):
+        cache.enable()
+        symmetry_indices(self.squaroid).append(0)
+        self.assertEqual(symmetry_indices(self.squaroid), [1, 4, 7, 10])
+
+    def test_eviction(self):
+        cache.enable(maxsize=2)
+        for ring in ["AB", "ABC", "AB", "ABCD"]:
+            rotational_symmetry(ring)
+        self.assertEqual(cache.info(), cache.CacheInfo(1, 3, 2, 2))
+        rotational_symmetry("ABC")
+        self.assertEqual(cache.info().misses, 4)
+
+    def test_unhashable(self):
+        cache.enable()
+        self.assertEqual(rotational_symmetry(([1], [1])), 2)
+        self.assertEqual(cache.info().currsize, 0)
+
+    def test_clear(self):
+        cache.enable()
+        rotational_symmetry("ABAB")
+        cache.clear()
+        self.assertEqual(cache.info(), cache.CacheInfo(0, 0, 4096, 0))
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            cache.enable(maxsize=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from ring_seq.methods import BraceletKey, NecklaceKey, canonical_bracelet, canonical_index, canonical_rotation, \
+    group_by_dihedral, group_by_rotation, rotations, rotations_and_reflections
+
+
+class CanonicalOps(unittest.TestCase):
+
+    def setUp(self):
+        self.squaroid: tuple = (2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2)
+
+    def test_canonical_index(self):
+        self.assertEqual(canonical_index(""), 0)
+        self.assertEqual(canonical_index("A"), 0)
+        self.assertEqual(canonical_index("CDEAB"), 3)
+        self.assertEqual(canonical_index("BABA"), 1)
+        self.assertEqual(canonical_index(self.squaroid), 1)
+        self.assertEqual(canonical_index([3, 1, 2, 1, 1]), 3)
+
+    def test_canonical_rotation(self):
+        self.assertEqual(canonical_rotation(""), "")
+        self.assertEqual(canonical_rotation([]), [])
+        self.assertEqual(canonical_rotation("CDEAB"), "ABCDE")
+        self.assertEqual(canonical_rotation(self.squaroid), (1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2))
+        self.assertEqual(canonical_rotation([3, 1, 2, 1, 1]), [1, 1, 3, 1, 2])
+
+    def test_canonical_rotation_is_min_of_rotations(self):
+        for ring in ["ABCDE", "ABAB", "BAABAB", "CBACBACBA", "AAAAB", "BAAAA", "ABABAA"]:
+            self.assertEqual(canonical_rotation(ring), min(rotations(ring)))
+
+    def test_canonical_bracelet(self):
+        self.assertEqual(canonical_bracelet(""), "")
+        self.assertEqual(canonical_bracelet("CBAED"), "ABCDE")
+        self.assertEqual(canonical_bracelet(self.squaroid), (1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2))
+        self.assertEqual(canonical_bracelet([1, 3, 1, 2]), [1, 2, 1, 3])
+
+    def test_canonical_bracelet_is_min_of_rotations_and_reflections(self):
+        for ring in ["ABCDE", "ACBD", "BAABAB", "CBACBACBA", "AAAAB", "ABCABD", "DCBA"]:
+            self.assertEqual(canonical_bracelet(ring), min(rotations_and_reflections(ring)))
+
+    def test_necklace_key(self):
+        self.assertEqual(NecklaceKey("CDEAB"), NecklaceKey("ABCDE"))
+        self.assertEqual(hash(NecklaceKey("CDEAB")), hash(NecklaceKey("ABCDE")))
+        self.assertNotEqual(NecklaceKey("ABCDE"), NecklaceKey("EDCBA"))
+        self.assertNotEqual(NecklaceKey([1, 2]), NecklaceKey((1, 2)))
+        self.assertNotEqual(NecklaceKey("AB"), BraceletKey("AB"))
+        self.assertEqual(NecklaceKey([3, 1, 2, 1, 1]).canonical, [1, 1, 3, 1, 2])
+        self.assertEqual(NecklaceKey(""), NecklaceKey(""))
+
+    def test_bracelet_key(self):
+        self.assertEqual(BraceletKey("ABCDE"), BraceletKey("DCBAE"))
+        self.assertNotEqual(BraceletKey("ABCABD"), BraceletKey("ABCADB"))
+        self.assertEqual(BraceletKey([1, 3, 1, 2]).canonical, [1, 2, 1, 3])
+
+    def test_keys_group_in_dict(self):
+        groups: dict = {}
+        for ring in ["ABCD", "BCDA", "DCBA", "ABDC", "CDAB", "CABD"]:
+            groups.setdefault(BraceletKey(ring), []).append(ring)
+        self.assertEqual(list(groups.values()), [["ABCD", "BCDA", "DCBA", "CDAB"], ["ABDC", "CABD"]])
+        self.assertEqual(len(set(map(NecklaceKey, ["ABCD", "BCDA", "DCBA", "ABDC", "CDAB", "ACBD"]))), 4)
+
+    def test_group_by_rotation(self):
+        rings: list = [[1, 2, 3], [2, 3, 1], [3, 2, 1], [1, 1, 2], [2, 1, 1], [1, 3, 2]]
+        self.assertEqual(
+            group_by_rotation(rings),
+            [([1, 2, 3], [[1, 2, 3], [2, 3, 1]]), ([1, 3, 2], [[3, 2, 1], [1, 3, 2]]), ([1, 1, 2], [[1, 1, 2], [2, 1, 1]])]
+        )
+        self.assertEqual(group_by_rotation(iter(rings), counts=True), [([1, 2, 3], 2), ([1, 3, 2], 2), ([1, 1, 2], 2)])
+        self.assertEqual(group_by_rotation([]), [])
+
+    def test_group_by_dihedral(self):
+        rings: list = ["ABCD", "BCDA", "DCBA", "ABDC", "CDAB", "CABD", ""]
+        self.assertEqual(
+            group_by_dihedral(rings),
+            [("ABCD", ["ABCD", "BCDA", "DCBA", "CDAB"]), ("ABDC", ["ABDC", "CABD"]), ("", [""])]
+        )
+        self.assertEqual(group_by_dihedral(rings, counts=True), [("ABCD", 4), ("ABDC", 2), ("", 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,15 +7,33 @@ class ComparingOps(unittest.TestCase):
 
     def test_is_rotation_of(self):
         self.assertTrue(is_rotation_of("ABCDE", "CDEAB"))
+        self.assertFalse(is_rotation_of("ABCDE", "CDEBA"))
+        self.assertFalse(is_rotation_of("ABCDE", "CDEA"))
+        self.assertFalse(is_rotation_of("", ""))
+        self.assertTrue(is_rotation_of([1, 2, 1, 2, 3], [2, 3, 1, 2, 1]))
+        self.assertFalse(is_rotation_of([1, 2, 1, 2, 3], [2, 1, 1, 2, 3]))
+        self.assertTrue(is_rotation_of((1, 1, 2), (1, 2, 1)))
+        self.assertFalse(is_rotation_of((1, 1, 2), [1, 2, 1]))
+        self.assertFalse(is_rotation_of("ABC", ["B", "C", "A"]))
 
     def test_is_reflection_of(self):
         self.assertTrue(is_reflection_of("ABCDE", "AEDCB"))
+        self.assertTrue(is_reflection_of("ABCDE", "ABCDE"))
+        self.assertFalse(is_reflection_of("ABCDE", "EDCBA"))
+        self.assertFalse(is_reflection_of("", ""))
+        self.assertTrue(is_reflection_of([1, 2, 3], [1, 3, 2]))
+        self.assertFalse(is_reflection_of([1, 2, 3], (1, 3, 2)))
 
     def test_is_reversion_of(self):
         self.assertTrue(is_reversion_of("ABCDE", "EDCBA"))
 
     def test_is_rotation_or_reflection_of(self):
         self.assertTrue(is_rotation_or_reflection_of("ABCDE", "CBAED"))
+        self.assertTrue(is_rotation_or_reflection_of("ABCDE", "CDEAB"))
+        self.assertFalse(is_rotation_or_reflection_of("ABCDE", "ACBDE"))
+        self.assertFalse(is_rotation_or_reflection_of("", ""))
+        self.assertTrue(is_rotation_or_reflection_of((1, 1, 2, 3), (2, 1, 1, 3)))
+        self.assertFalse(is_rotation_or_reflection_of((1, 1, 2, 3), (2, 1, 3, 1)))
 
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 import unittest
 
-from ring_seq.methods import reflections, reversions, rotations, rotations_and_reflections
+from ring_seq.methods import distinct_rotations, distinct_rotations_and_reflections, orbit_size, reflection_views, \
+    reflections, reversions, rotation_and_reflection_views, rotation_views, rotations, rotations_and_reflections
 
 
 class IteratingOps(unittest.TestCase):
@@ -44,6 +45,59 @@ class IteratingOps(unittest.TestCase):
             ]
         )
 
+    def test_distinct_rotations(self):
+        self.assertEqual(list(distinct_rotations([])), [])
+        self.assertEqual(list(distinct_rotations("ABCDE")), list(rotations("ABCDE")))
+        self.assertEqual(list(distinct_rotations("-|--|--|--|-")), ["-|--|--|--|-", "|--|--|--|--", "--|--|--|--|"])
+        self.assertEqual(list(distinct_rotations((1, 1, 1))), [(1, 1, 1)])
+
+    def test_distinct_rotations_and_reflections(self):
+        self.assertEqual(list(distinct_rotations_and_reflections([])), [])
+        self.assertEqual(
+            list(distinct_rotations_and_reflections("-|--|--|--|-")),
+            ["-|--|--|--|-", "|--|--|--|--", "--|--|--|--|"]
+        )
+        self.assertEqual(
+            list(distinct_rotations_and_reflections("-|+-|+-|+-|+")),
+            ["-|+-|+-|+-|+", "|+-|+-|+-|+-", "+-|+-|+-|+-|", "-+|-+|-+|-+|", "+|-+|-+|-+|-", "|-+|-+|-+|-+"]
+        )
+        for ring in ["ABCDE", "ABAB", "AABC", "ABCABC", "ABACABAC", "AAAAB"]:
+            result: list[str] = list(distinct_rotations_and_reflections(ring))
+            self.assertEqual(len(result), len(set(result)))
+            self.assertEqual(set(result), set(rotations_and_reflections(ring)))
+
+    def test_orbit_size(self):
+        self.assertEqual(orbit_size(""), 0)
+        self.assertEqual(orbit_size("ABCDE"), 10)
+        self.assertEqual(orbit_size("ABCBA"), 5)
+        self.assertEqual(orbit_size("-|--|--|--|-"), 3)
+        self.assertEqual(orbit_size("-|+-|+-|+-|+"), 6)
+        self.assertEqual(orbit_size((1, 1, 1)), 1)
+
+    def test_rotation_views(self):
+        self.assertEqual(list(rotation_views([])), [])
+        self.assertEqual(list(rotation_views("")), [])
+        self.assertEqual(list(map(lambda v: v[:], rotation_views("ABCDE"))), list(rotations("ABCDE")))
+        self.assertEqual(list(map(lambda v: v[0], rotation_views((1, 2, 3)))), [1, 2, 3])
+
+    def test_reflection_views(self):
+        self.assertEqual(list(reflection_views([])), [])
+        self.assertEqual(list(map(lambda v: v[:], reflection_views("ABCDE"))), list(reflections("ABCDE")))
+
+    def test_rotation_and_reflection_views(self):
+        self.assertEqual(list(rotation_and_reflection_views(())), [])
+        self.assertEqual(
+            list(map(lambda v: v[:], rotation_and_reflection_views("ABCDE"))),
+            list(rotations_and_reflections("ABCDE"))
+        )
+        self.assertEqual(
+            list(map(lambda v: v[:], rotation_and_reflection_views(["A", 1, 'B', 2]))),
+            list(rotations_and_reflections(["A", 1, 'B', 2]))
+        )
+        ring: list = [1, 2, 3]
+        views: list = list(rotation_and_reflection_views(ring))
+        self.assertTrue(all(map(lambda v: v.underlying is ring, views)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,115 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from ring_seq.mapped import MappedRing
+from ring_seq.methods import BraceletKey, NecklaceKey, apply_o, canonical_rotation, find_all_o, index_o, \
+    index_of_slice_o, is_reflection_of, is_rotation_of, reflect_at_view, rotate_left, rotate_right, rotate_right_view, \
+    rotation_views, rotational_symmetry, slice_o, symmetry, symmetry_indices
+
+
+class MappedOps(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def mapped(self, content: bytes, format: str = 'B') -> MappedRing:
+        path: str = os.path.join(self.directory.name, f"ring{len(os.listdir(self.directory.name))}.bin")
+        with open(path, 'wb') as file:
+            file.write(content)
+        ring: MappedRing = MappedRing(path, format)
+        self.addCleanup(ring.close)
+        return ring
+
+    def test_sequence(self):
+        ring: MappedRing = self.mapped(b'ABCD')
+        self.assertEqual(len(ring), 4)
+        self.assertEqual(ring[1], ord('B'))
+        self.assertEqual(ring[-1], ord('D'))
+        self.assertEqual(ring[1:3], (ord('B'), ord('C')))
+        self.assertEqual(list(ring), list(b'ABCD'))
+        self.assertIn(ord('C'), ring)
+        self.assertEqual(ring.index(ord('C')), 2)
+        with self.assertRaises(IndexError):
+            var = ring[4]
+
+    def test_records(self):
+        ring: MappedRing = self.mapped(b''.join(map(lambda i: struct.pack('<Ih', i % 3, -i), range(6))), '<Ih')
+        self.assertEqual(ring.record_size, 6)
+        self.assertEqual(len(ring), 6)
+        self.assertEqual(ring[4], (1, -4))
+        self.assertEqual(ring[::2], ((0, 0), (2, -2), (1, -4)))
+        self.assertEqual(ring.index((2, -5)), 5)
+        self.assertNotIn((2, 0), ring)
+
+    def test_unaligned_search(self):
+        ring: MappedRing = self.mapped(struct.pack('<2H', 0x0100, 0x0001), '<H')
+        self.assertEqual(ring.index(1), 1)
+        self.assertEqual(ring.index(0x0100), 0)
+
+    def test_floats(self):
+        ring: MappedRing = self.mapped(struct.pack('3d', 0.5, -0.0, 0.5), 'd')
+        self.assertEqual(ring.index(0.0), 1)
+        self.assertEqual(rotational_symmetry(ring), 1)
+
+    def test_methods(self):
+        ring: MappedRing = self.mapped(b'-|--|--|--|-')
+        self.assertEqual(apply_o(ring, 13), ord('|'))
+        self.assertEqual(slice_o(ring, -1, 2), tuple(b'--|'))
+        self.assertEqual(rotate_right(ring, 1), tuple(rotate_right(b'-|--|--|--|-', 1)))
+        self.assertEqual(index_o(ring, ord('|'), 2), 4)
+        self.assertEqual(index_of_slice_o(ring, tuple(b'--|')), 2)
+        self.assertEqual(list(find_all_o(ring, tuple(b'|-'))), [1, 4, 7, 10])
+        self.assertEqual(rotational_symmetry(ring), 4)
+        self.assertEqual(symmetry_indices(ring), [1, 4, 7, 10])
+        self.assertTrue(is_rotation_of(ring, rotate_left(ring, 5)))
+        self.assertTrue(is_reflection_of(ring, tuple(b'-|--|--|--|-')))
+        self.assertEqual(canonical_rotation(self.mapped(b'CAB')), tuple(b'ABC'))
+
+    def test_views(self):
+        ring: MappedRing = self.mapped(b'ABCDE')
+        self.assertEqual(rotate_right_view(ring, 1)[0], ord('E'))
+        self.assertEqual(reflect_at_view(ring, 1)[:3], tuple(b'BAE'))
+        self.assertEqual(len(list(rotation_views(ring))), 5)
+
+    def test_rotational_symmetry(self):
+        self.assertEqual(rotational_symmetry(self.mapped(b'AB' * 1000)), 1000)
+        self.assertEqual(rotational_symmetry(self.mapped(b'AB' * 1000 + b'A')), 1)
+        self.assertEqual(rotational_symmetry(self.mapped(struct.pack('<6H', *(1, 2, 3) * 2), '<H')), 2)
+        self.assertEqual(rotational_symmetry(self.mapped(struct.pack('<IhIh', 1, 2, 1, 2), '<Ih')), 2)
+
+    def test_signed_zeros(self):
+        self.assertEqual(rotational_symmetry(self.mapped(struct.pack('<2d', 0.0, -0.0), '<d')), 2)
+        self.assertEqual(rotational_symmetry(self.mapped(struct.pack('2d', 0.0, -0.0), 'd')), 2)
+        ring: MappedRing = self.mapped(struct.pack('<4d', 0.0, 1.0, -0.0, 1.0), '<dd')
+        self.assertEqual(rotational_symmetry(ring), 2)
+        self.assertEqual(symmetry(ring), 2)
+        self.assertEqual(ring.index((0.0, 1.0), 1), 1)
+
+    def test_booleans(self):
+        ring: MappedRing = self.mapped(bytes([1, 2, 1, 2]), '?')
+        self.assertFalse(ring.is_comparable_in_place)
+        self.assertEqual(rotational_symmetry(ring), 4)
+        self.assertEqual(ring.index(True, 1), 1)
+
+    def test_empty(self):
+        ring: MappedRing = self.mapped(b'')
+        self.assertEqual(len(ring), 0)
+        self.assertEqual(ring[:], ())
+        self.assertEqual(rotational_symmetry(ring), 1)
+        with self.assertRaises(ValueError):
+            var = index_o(ring, 0)
+        self.assertEqual(NecklaceKey(ring), NecklaceKey(()))
+        self.assertEqual(BraceletKey(ring), BraceletKey(self.mapped(b'')))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            var = self.mapped(b'ABC', '<H')
+
+
+if __name__ == '__main__':
+    unittest.main()
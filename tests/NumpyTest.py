@@ -0,0 +1,81 @@
+import unittest
+
+from ring_seq.methods import canonical_bracelet, canonical_index, canonical_rotation, find_all_o, index_o, index_of_slice_o, \
+    is_reflection_of, is_reversion_of, is_rotation_of, is_rotation_or_reflection_of, reflect_at, rotate_left, \
+    rotate_right, rotational_symmetry, rotations, slice_o, start_at, symmetry, symmetry_indices
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NumpyOps(unittest.TestCase):
+
+    def setUp(self):
+        self.ring = numpy.array([1, 2, 3, 4, 5])
+        self.squaroid = numpy.array([2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2])
+
+    def assertArrayEqual(self, result, expected: list):
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual(result.tolist(), expected)
+
+    def test_transforming(self):
+        self.assertArrayEqual(rotate_right(self.ring, 1), [5, 1, 2, 3, 4])
+        self.assertArrayEqual(rotate_left(self.ring, 6), [2, 3, 4, 5, 1])
+        self.assertArrayEqual(start_at(self.ring, -1), [5, 1, 2, 3, 4])
+        self.assertArrayEqual(reflect_at(self.ring), [1, 5, 4, 3, 2])
+        self.assertArrayEqual(reflect_at(self.ring, 1), [2, 1, 5, 4, 3])
+        self.assertEqual(rotate_left(numpy.array([0.5, 1.5]), 1).dtype, numpy.float64)
+
+    def test_slicing(self):
+        self.assertArrayEqual(slice_o(self.ring, -1, 6), [5, 1, 2, 3, 4, 5, 1])
+        self.assertArrayEqual(slice_o(self.ring, -1, 6, 2), [5, 2, 4, 1])
+        self.assertArrayEqual(slice_o(self.ring, 3, 3), [])
+        self.assertEqual(index_o(self.ring, 1, 2), 0)
+        with self.assertRaises(ValueError):
+            var = index_o(self.ring, 6)
+        self.assertEqual(index_of_slice_o(self.ring, numpy.array([5, 1]), 1), 4)
+        self.assertEqual(index_of_slice_o(self.ring, [4, 5, 1, 2]), 3)
+        self.assertEqual(list(find_all_o(self.squaroid, numpy.array([2, 2]))), [2, 5, 8, 11])
+
+    def test_iterating(self):
+        result: list = list(map(lambda r: r.tolist(), rotations(numpy.array([1, 2, 3]))))
+        self.assertEqual(result, [[1, 2, 3], [2, 3, 1], [3, 1, 2]])
+
+    def test_comparing(self):
+        self.assertTrue(is_rotation_of(self.ring, numpy.array([3, 4, 5, 1, 2])))
+        self.assertFalse(is_rotation_of(self.ring, numpy.array([3, 4, 5, 2, 1])))
+        self.assertFalse(is_rotation_of(self.ring, [3, 4, 5, 1, 2]))
+        self.assertTrue(is_rotation_of(self.ring, numpy.array([3.0, 4.0, 5.0, 1.0, 2.0])))
+        self.assertTrue(is_rotation_of(numpy.array([0.0, 1.0]), numpy.array([1.0, -0.0])))
+        self.assertFalse(is_rotation_of(numpy.array([numpy.nan, 1.0]), numpy.array([1.0, numpy.nan])))
+        self.assertFalse(is_rotation_of(numpy.array([1, 2]), numpy.array(["1", "2"])))
+        self.assertTrue(is_reflection_of(self.ring, numpy.array([1, 5, 4, 3, 2])))
+        self.assertTrue(is_reversion_of(self.ring, numpy.array([5, 4, 3, 2, 1])))
+        self.assertTrue(is_rotation_or_reflection_of(self.ring, numpy.array([3, 2, 1, 5, 4])))
+        self.assertTrue(is_rotation_of(numpy.array(["A", "B"]), numpy.array(["B", "A"])))
+        self.assertTrue(is_rotation_of(numpy.array([(1, 2), 3], dtype=object), numpy.array([3, (1, 2)], dtype=object)))
+
+    def test_symmetry(self):
+        self.assertEqual(rotational_symmetry(self.ring), 1)
+        self.assertEqual(rotational_symmetry(self.squaroid), 4)
+        self.assertEqual(symmetry_indices(self.squaroid), [1, 4, 7, 10])
+        self.assertEqual(symmetry(self.squaroid), 4)
+        self.assertEqual(symmetry(numpy.array([0.1, 0.2, 0.3, 0.2])), 1)
+
+    def test_canonical(self):
+        self.assertArrayEqual(canonical_rotation(numpy.array([3, 1, 2, 1, 1])), [1, 1, 3, 1, 2])
+        self.assertArrayEqual(canonical_bracelet(numpy.array([1, 3, 1, 2])), [1, 2, 1, 3])
+
+    def test_canonical_index(self):
+        self.assertEqual(canonical_index(numpy.array([3, 1, 2, 1, 1])), 3)
+        self.assertEqual(canonical_index(numpy.array([2, 1, 2, 1, 2, 1])), 1)
+        self.assertEqual(canonical_index(numpy.zeros(1000)), 0)
+        self.assertEqual(canonical_index(numpy.array(list('BABAA'))), 3)
+        self.assertEqual(canonical_index(numpy.array([0.5, -0.0, 0.0, 0.5])), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
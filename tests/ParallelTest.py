@@ -0,0 +1,77 @@
+import unittest
+
+from ring_seq.methods import canonical_bracelet, canonical_rotation, group_by_dihedral, symmetry
+from ring_seq import parallel
+
+try:
+    import numpy
+    from ring_seq.batch import canonical_bracelet_batch, canonical_rotation_batch, symmetry_batch
+except ImportError:
+    numpy = None
+
+
+class ParallelOps(unittest.TestCase):
+
+    def setUp(self):
+        self.rings: list = [
+            (2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2),
+            (1, 2, 3, 1, 2),
+            (3, 2, 1, 2, 1),
+            (1, 1, 2, 2),
+            (2, 1, 2, 1, 1),
+            (1, 2, 2, 1),
+            ()
+        ]
+
+    def test_map_symmetry(self):
+        self.assertEqual(parallel.map_symmetry(self.rings, max_workers=2, chunksize=2), list(map(symmetry, self.rings)))
+
+    def test_map_canonical(self):
+        self.assertEqual(
+            parallel.map_canonical(self.rings, max_workers=2, chunksize=2), list(map(canonical_rotation, self.rings))
+        )
+        self.assertEqual(
+            parallel.map_canonical(self.rings, bracelet=True, max_workers=2, chunksize=2),
+            list(map(canonical_bracelet, self.rings))
+        )
+
+    def test_group_by_dihedral(self):
+        for counts in (False, True):
+            self.assertEqual(
+                parallel.group_by_dihedral(iter(self.rings), counts=counts, max_workers=2, chunksize=2),
+                group_by_dihedral(self.rings, counts=counts)
+            )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_shared_batches(self):
+        rows: numpy.ndarray = numpy.array([
+            [2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2],
+            [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
+            [3, 1, 1, 2, 1, 1, 3, 1, 1, 2, 1, 1]
+        ])
+        self.assertEqual(parallel.map_symmetry(rows, max_workers=2, chunksize=2).tolist(), symmetry_batch(rows).tolist())
+        self.assertEqual(
+            parallel.map_canonical(rows, max_workers=2, chunksize=2).tolist(), canonical_rotation_batch(rows).tolist()
+        )
+        bracelets: numpy.ndarray = parallel.map_canonical(rows, bracelet=True, max_workers=2, chunksize=2)
+        self.assertIsInstance(bracelets, numpy.ndarray)
+        self.assertEqual(bracelets.tolist(), canonical_bracelet_batch(rows).tolist())
+        self.assertEqual(bracelets.tolist(), list(map(canonical_bracelet, rows.tolist())))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_shared_group_by_dihedral(self):
+        rows: numpy.ndarray = numpy.array([[1, 2, 3, 4], [2, 1, 4, 3], [1, 2, 4, 3], [3, 4, 1, 2]])
+        for counts in (False, True):
+            result: list = parallel.group_by_dihedral(rows, counts=counts, max_workers=2, chunksize=2)
+            expected: list = group_by_dihedral(rows, counts=counts)
+            self.assertEqual(list(map(lambda group: group[0].tolist(), result)),
+                             list(map(lambda group: group[0].tolist(), expected)))
+            if counts:
+                self.assertEqual(list(map(lambda group: group[1], result)), [3, 1])
+            else:
+                self.assertEqual(list(map(lambda group: list(map(list, group[1])), result)),
+                                 list(map(lambda group: list(map(list, group[1])), expected)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import sys
+import unittest
+
+from ring_seq.RingSeq import RingSeq
+from ring_seq.methods import canonical_rotation, is_rotation_of, reflect_at, rotate_right, rotations, slice_o
+from ring_seq.profiling import Tracker, track
+
+
+class ProfilingOps(unittest.TestCase):
+
+    def test_copies(self):
+        with track() as tracker:
+            rotate_right([1, 2, 3, 4], 1)
+            slice_o("ABC", -1, 5)
+        self.assertEqual(tracker.functions["rotate_right"].copies, 1)
+        self.assertEqual(tracker.functions["rotate_right"].allocated, 4)
+        self.assertEqual(tracker.functions["slice_o"].copies, 1)
+        self.assertEqual(tracker.functions["slice_o"].allocated, 6)
+
+    def test_outermost_call(self):
+        with track() as tracker:
+            reflect_at((1, 2, 3), 1)
+            RingSeq("CAB").canonical_rotation()
+        self.assertEqual(sorted(tracker.functions), ["canonical_rotation", "reflect_at"])
+        self.assertEqual(tracker.functions["reflect_at"].calls, 1)
+        self.assertEqual(tracker.functions["reflect_at"].copies, 1)
+        self.assertGreater(tracker.functions["canonical_rotation"].comparisons, 0)
+        self.assertGreaterEqual(tracker.functions["canonical_rotation"].seconds, 0)
+
+    def test_comparisons(self):
+        with track() as tracker:
+            is_rotation_of("ABCDE", "CDEAB")
+        self.assertEqual(tracker.functions["is_rotation_of"].comparisons, 10)
+
+    def test_lazy_results(self):
+        with track() as tracker:
+            list(rotations((1, 2, 3)))
+        self.assertEqual(tracker.functions["rotations"].calls, 1)
+        self.assertEqual(tracker.functions["rotate_left"].copies, 3)
+
+    def test_nested_blocks(self):
+        with track() as outer:
+            canonical_rotation("BA")
+            with track() as inner:
+                canonical_rotation("CAB")
+        self.assertEqual(outer.functions["canonical_rotation"].calls, 2)
+        self.assertEqual(inner.functions["canonical_rotation"].calls, 1)
+        self.assertEqual(outer.total().calls, 2)
+
+    def test_untracked_outside(self):
+        with track() as tracker:
+            pass
+        rotate_right("ABC", 1)
+        self.assertEqual(tracker.functions, {})
+        self.assertIsNone(sys.getprofile())
+
+    def test_report(self):
+        tracker: Tracker = Tracker()
+        tracker.stats("symmetry").calls += 1
+        self.assertEqual(tracker.report().splitlines()[1].split()[:2], ["symmetry", "1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -39,11 +39,44 @@ class RingSeqOps(unittest.TestCase):
         result: str = self.ring.reflect_at(1)
         self.assertEqual(result, "BAEDC")
 
+    def test_viewing(self):
+        # "ABCDE" rotated one step to the right, without copying, starts with "E"
+        result: str = self.ring.rotate_right_view(1)[0]
+        self.assertEqual(result, "E")
+
+        # "ABCDE" rotated one step to the left, without copying, ends with "A"
+        result: str = self.ring.rotate_left_view(1)[-1]
+        self.assertEqual(result, "A")
+
+        # "ABCDE" rotated to start at circular index 1, without copying, materialized is "BCDEA"
+        result: str = self.ring.start_at_view(1)[:]
+        self.assertEqual(result, "BCDEA")
+
+        # "ABCDE" rotated to start at circular index 1 and reflected, without copying, materialized is "BAEDC"
+        result: str = self.ring.reflect_at_view(1)[:]
+        self.assertEqual(result, "BAEDC")
+
     def test_slicing(self):
         # "ABCDE" sliced from circular index -1 to circular index 6 is "EABCDEA"
         result: str = self.ring.slice_o(-1, 6)
         self.assertEqual(result, "EABCDEA")
 
+        # "ABCDE" iterated from circular index -1 to circular index 6 every 2 elements gives "E", "B", "D" and "A"
+        result: list[str] = list(self.ring.islice_o(-1, 6, 2))
+        self.assertEqual(result, ["E", "B", "D", "A"])
+
+        # "ABCDE" contains "EAB" starting at index 4
+        result: Index = self.ring.index_o("EAB")
+        self.assertEqual(result, 4)
+
+        # (2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2) contains (1, 2, 2) starting from index 1
+        result: Index = self.squaroid.index_of_slice_o((1, 2, 2))
+        self.assertEqual(result, 1)
+
+        # (2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2) contains (1, 2, 2) starting from indices 1, 4, 7 and 10
+        result: list[Index] = list(self.squaroid.find_all_o((1, 2, 2)))
+        self.assertEqual(result, [1, 4, 7, 10])
+
     def test_iterating(self):
         # All 5 "ABCDE" rotations
         result: list[str] = list(self.ring.rotations())
@@ -64,6 +97,35 @@ class RingSeqOps(unittest.TestCase):
             ["ABCDE", "BCDEA", "CDEAB", "DEABC", "EABCD", "AEDCB", "EDCBA", "DCBAE", "CBAED", "BAEDC"]
         )
 
+    def test_iterating_distinct(self):
+        # The 3 different rotations of (2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2)
+        result: list[tuple] = list(self.squaroid.distinct_rotations())
+        self.assertEqual(result, [(2, 1, 2) * 4, (1, 2, 2) * 4, (2, 2, 1) * 4])
+
+        # The same 3, reflections being equal to rotations
+        result: list[tuple] = list(self.squaroid.distinct_rotations_and_reflections())
+        self.assertEqual(result, [(2, 1, 2) * 4, (1, 2, 2) * 4, (2, 2, 1) * 4])
+
+        # "ABCDE" has 10 different rotations and reflections
+        result: int = self.ring.orbit_size()
+        self.assertEqual(result, 10)
+
+    def test_iterating_views(self):
+        # All 5 "ABCDE" rotations, without copying, start with each element
+        result: list[str] = list(map(lambda v: v[0], self.ring.rotation_views()))
+        self.assertEqual(result, ["A", "B", "C", "D", "E"])
+
+        # The two "ABCDE" reflections, without copying, end with "E" and "B"
+        result: list[str] = list(map(lambda v: v[-1], self.ring.reflection_views()))
+        self.assertEqual(result, ["E", "B"])
+
+        # All 10 "ABCDE" rotations and reflections, without copying, materialized
+        result: list[str] = list(map(lambda v: v[:], self.ring.rotation_and_reflection_views()))
+        self.assertEqual(
+            result,
+            ["ABCDE", "BCDEA", "CDEAB", "DEABC", "EABCD", "AEDCB", "EDCBA", "DCBAE", "CBAED", "BAEDC"]
+        )
+
     def test_comparing(self):
         # "ABCDE" is a rotation of "CDEAB"
         result: bool = self.ring.is_rotation_of("CDEAB")
@@ -82,6 +144,10 @@ class RingSeqOps(unittest.TestCase):
         self.assertTrue(result)
 
     def test_symmetry(self):
+        # (2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2) is (2, 1, 2) repeated
+        result: tuple = self.squaroid.primitive_period()
+        self.assertEqual(result, (2, 1, 2))
+
         # (2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2) has 4 rotational symmetries
         result: int = self.squaroid.rotational_symmetry()
         self.assertEqual(result, 4)
@@ -94,6 +160,57 @@ class RingSeqOps(unittest.TestCase):
         result: int = self.squaroid.symmetry()
         self.assertEqual(result, 4)
 
+    def test_canonical(self):
+        # "CDEAB" smallest rotation starts at circular index 3
+        result: Index = RingSeq("CDEAB").canonical_index()
+        self.assertEqual(result, 3)
+
+        # "CDEAB" smallest rotation is "ABCDE"
+        result: str = RingSeq("CDEAB").canonical_rotation()
+        self.assertEqual(result, "ABCDE")
+
+        # "CBAED" smallest rotation or reflection is "ABCDE"
+        result: str = RingSeq("CBAED").canonical_bracelet()
+        self.assertEqual(result, "ABCDE")
+
+    def test_slots(self):
+        # RingSeq keeps no instance dictionary
+        self.assertFalse(hasattr(self.ring, "__dict__"))
+        self.assertFalse(hasattr(FrozenRingSeq("ABCDE"), "__dict__"))
+
+    def test_frozen(self):
+        frozen: FrozenRingSeq = FrozenRingSeq(self.squaroid.underlying)
+        for _ in range(2):
+            # cached results are the same as RingSeq ones
+            self.assertEqual(len(frozen), 12)
+            self.assertEqual(frozen.primitive_period(), self.squaroid.primitive_period())
+            self.assertEqual(frozen.rotational_symmetry(), self.squaroid.rotational_symmetry())
+            self.assertEqual(frozen.symmetry_indices(), self.squaroid.symmetry_indices())
+            self.assertEqual(frozen.symmetry(), self.squaroid.symmetry())
+            self.assertEqual(frozen.orbit_size(), self.squaroid.orbit_size())
+            self.assertEqual(frozen.canonical_index(), self.squaroid.canonical_index())
+            self.assertEqual(frozen.canonical_rotation(), self.squaroid.canonical_rotation())
+        for ring in ["", "A", "ABCDE", "ABCBA"]:
+            self.assertEqual(FrozenRingSeq(ring).rotational_symmetry(), RingSeq(ring).rotational_symmetry())
+            self.assertEqual(FrozenRingSeq(ring).symmetry(), RingSeq(ring).symmetry())
+            self.assertEqual(FrozenRingSeq(ring).orbit_size(), RingSeq(ring).orbit_size())
+            self.assertEqual(FrozenRingSeq(ring).canonical_rotation(), RingSeq(ring).canonical_rotation())
+
+    def test_frozen_returned_indices_are_copies(self):
+        frozen: FrozenRingSeq = FrozenRingSeq("ABA")
+        frozen.symmetry_indices().append(5)
+        self.assertEqual(frozen.symmetry_indices(), [1])
+
+    def test_frozen_hashing(self):
+        self.assertEqual(FrozenRingSeq("ABC"), FrozenRingSeq("ABC"))
+        self.assertNotEqual(FrozenRingSeq("ABC"), FrozenRingSeq("BCA"))
+        self.assertEqual(len({FrozenRingSeq("ABC"), FrozenRingSeq("ABC"), FrozenRingSeq((1, 2))}), 2)
+        self.assertEqual(FrozenRingSeq("ABC").necklace_key(), FrozenRingSeq("BCA").necklace_key())
+
+    def test_frozen_mutable(self):
+        with self.assertRaises(TypeError):
+            var = FrozenRingSeq([1, 2, 3])
+
 
 if __name__ == '__main__':
     unittest.main()
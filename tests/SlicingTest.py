@@ -1,6 +1,6 @@
 import unittest
 
-from ring_seq.methods import slice_o, index_o
+from ring_seq.methods import slice_o, islice_o, index_o, index_of_slice_o, find_all_o
 
 
 class SlicingOps(unittest.TestCase):
@@ -23,6 +23,24 @@ class SlicingOps(unittest.TestCase):
         self.assertEqual(slice_o("ABCDE", 0, 5, 3), "AD")
         self.assertEqual("ABCDE"[0:5:2], "ACE")
         self.assertEqual(slice_o(("A", 1, 'B', 2), -1, 6, 2), (2, 1, 2, 1))
+        self.assertEqual(slice_o("ABCDE", 2, 14), "CDEABCDEABCD")
+        self.assertEqual(slice_o("ABCDE", 2, 14, 3), "CADB")
+        self.assertEqual(slice_o("ABCDE", 2, 14, 7), "CE")
+        self.assertEqual(slice_o(["A", 1, 'B', 2], 1, 12, 5), [1, 'B', 2])
+        self.assertEqual(slice_o([], 1, 12, 5), [])
+
+    def test_islice_o(self):
+        self.assertEqual(list(islice_o("ABCDE", -1, 6)), list("EABCDEA"))
+        self.assertEqual(list(islice_o("ABCDE", -1, 6, 2)), list("EBDA"))
+        self.assertEqual(list(islice_o("ABCDE", 3, 3)), [])
+        self.assertEqual(list(islice_o("ABCDE", 4, 3)), [])
+        self.assertEqual(list(islice_o("ABCDE", 4, 8, -1)), [])
+        self.assertEqual(list(islice_o([], 1, 3)), [])
+        with self.assertRaises(ValueError):
+            var = islice_o("ABCDE", 1, 3, 0)
+        for step in range(1, 8):
+            for start in range(-6, 6):
+                self.assertEqual(list(islice_o("ABCDE", start, 17, step)), list(slice_o("ABCDE", start, 17, step)))
 
     def test_index_o_behaving_like_index_list(self):
         self.assertEqual(["A", 1, 'B', 2].index("A"), 0)
@@ -110,6 +128,59 @@ class SlicingOps(unittest.TestCase):
         self.assertEqual(index_o("ABC", "BCA", 2, 7), 1)
         self.assertEqual(index_o("ABC", "BCAB", 2, 8), 1)
         self.assertEqual(index_o("ABCDE", "B", 2, 7), 1)
+        self.assertEqual(index_o("ABCDE", "EA", 2), 4)
+        self.assertEqual(index_o([1, 2, 3], 1, 2), 0)
+        self.assertEqual(index_o((1, 2, 3), 3, -1), 2)
+        with self.assertRaises(ValueError):
+            var = index_o([1, 2, 3], 1, 1, 3)
+
+    def test_index_of_slice_o(self):
+        self.assertEqual(index_of_slice_o(["A", 1, 'B', 2], ['B', 2]), 2)
+        self.assertEqual(index_of_slice_o(["A", 1, 'B', 2], [2, "A"]), 3)
+        self.assertEqual(index_of_slice_o(("A", 1, 'B', 2), (2, "A", 1, 'B', 2, "A"), 1), 3)
+        self.assertEqual(index_of_slice_o("ABCDE", "DEA"), 3)
+        self.assertEqual(index_of_slice_o([], []), 0)
+        self.assertEqual(index_of_slice_o([1, 2], [], 5), 1)
+        with self.assertRaises(ValueError):
+            var = index_of_slice_o(["A", 1, 'B', 2], [2, 1])
+        with self.assertRaises(ValueError):
+            var = index_of_slice_o(["A", 1, 'B', 2], [2, "A"], 0, 4)
+        with self.assertRaises(ValueError):
+            var = index_of_slice_o([], [1])
+
+    def test_find_all_o(self):
+        self.assertEqual(list(find_all_o("ABCDE", "B")), [1])
+        self.assertEqual(list(find_all_o("ABCDE", "EA")), [4])
+        self.assertEqual(list(find_all_o("ABCDE", "F")), [])
+        self.assertEqual(list(find_all_o("AAA", "AA")), [0, 1, 2])
+        self.assertEqual(list(find_all_o("AAA", "AA", 1)), [1, 2, 0])
+        self.assertEqual(list(find_all_o("AAA", "AA", overlapping=False)), [0, 2])
+        self.assertEqual(list(find_all_o("AAA", "AA", 0, 3)), [0, 1])
+        self.assertEqual(list(find_all_o("ABC", "", 0, 2)), [0, 1, 2])
+        self.assertEqual(list(find_all_o("ABC", "CABCA")), [2])
+        self.assertEqual(list(find_all_o(["A", 1, 'B', 1, 'B'], [1, 'B'])), [1, 3])
+        self.assertEqual(list(find_all_o((1, 2, 1, 2), (2, 1, 2))), [1, 3])
+        self.assertEqual(list(find_all_o((1, 2, 1, 2), (2, 1, 2), overlapping=False)), [1])
+        self.assertEqual(list(find_all_o([], [])), [0])
+        self.assertEqual(list(find_all_o([], [1])), [])
+
+    def test_find_all_o_consistent_with_index_of_slice_o(self):
+        for ring in ["ABABA", "AAAA", "ABCABD"]:
+            for that in ["A", "AB", "BA", "ABA", "DA", "AAAAA"]:
+                for start in range(-2, 3):
+                    found: list[int] = list(find_all_o(ring, that, start))
+                    self.assertEqual(found, list(find_all_o(list(ring), list(that), start)))
+                    if found:
+                        self.assertEqual(found[0], index_of_slice_o(ring, that, start))
+
+    def test_find_all_o_overlapping_periods(self):
+        self.assertEqual(len(list(find_all_o("A" * 10000, "A" * 1000))), 10000)
+        self.assertEqual(list(find_all_o("AABAAABAA", "AABAA")), [0, 4])
+        self.assertEqual(list(find_all_o(b"AABAAABAA", b"AABAA", overlapping=False)), [0])
+        for ring in ["AABAAABAA", "ABAABABAAB", "AAABAAAB"]:
+            for that in ["AA", "ABA", "AABAA", "ABAAB", "AAABAAA"]:
+                for start in range(-3, 3):
+                    self.assertEqual(list(find_all_o(ring, that, start)), list(find_all_o(list(ring), list(that), start)))
 
 
 if __name__ == '__main__':
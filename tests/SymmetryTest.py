@@ -1,6 +1,6 @@
 import unittest
 
-from ring_seq.methods import rotational_symmetry, symmetry, symmetry_indices
+from ring_seq.methods import primitive_period, rotational_symmetry, symmetry, symmetry_indices
 
 
 class SymmetryOps(unittest.TestCase):
@@ -12,6 +12,19 @@ class SymmetryOps(unittest.TestCase):
         self.axisOnElement: tuple = (1, 2, 3, 4, 3, 2)
         self.axisOffElement: tuple = (1, 2, 3, 4, 4, 3, 2, 1)
         self.axisOnOffElement: tuple = (1, 2, 3, 4, 4, 3, 2)
+        self.spin2: tuple = (1, 2, 3, 1, 2, 3)
+        self.square: str = "ABAB"
+
+    def test_primitive_period(self):
+        self.assertEqual(primitive_period("ABCDE"), "ABCDE")
+        self.assertEqual(primitive_period([]), [])
+        self.assertEqual(primitive_period(self.spin3), (1, 2, 3))
+        self.assertEqual(primitive_period(self.eptagon), (6,))
+        self.assertEqual(primitive_period(self.squaroid), (2, 1, 2))
+        self.assertEqual(primitive_period(self.spin2), (1, 2, 3))
+        self.assertEqual(primitive_period(self.square), "AB")
+        self.assertEqual(primitive_period("ABAABA"), "ABA")
+        self.assertEqual(primitive_period("ABAAB"), "ABAAB")
 
     def test_rotational_symmetry(self):
         self.assertEqual(rotational_symmetry("ABCDE"), 1)
@@ -22,6 +35,8 @@ class SymmetryOps(unittest.TestCase):
         self.assertEqual(rotational_symmetry(self.axisOnElement), 1)
         self.assertEqual(rotational_symmetry(self.axisOffElement), 1)
         self.assertEqual(rotational_symmetry(self.axisOnOffElement), 1)
+        self.assertEqual(rotational_symmetry(self.spin2), 2)
+        self.assertEqual(rotational_symmetry(self.square), 2)
 
     def test_symmetry_indices(self):
         self.assertEqual(symmetry_indices("ABCDE"), [])
@@ -32,6 +47,8 @@ class SymmetryOps(unittest.TestCase):
         self.assertEqual(symmetry_indices(self.axisOnElement), [0])
         self.assertEqual(symmetry_indices(self.axisOffElement), [3])
         self.assertEqual(symmetry_indices(self.axisOnOffElement), [0])
+        self.assertEqual(symmetry_indices(self.spin2), [])
+        self.assertEqual(symmetry_indices(self.square), [0, 2])
 
     def test_symmetry(self):
         self.assertEqual(symmetry("ABCDE"), 0)
@@ -42,6 +59,8 @@ class SymmetryOps(unittest.TestCase):
         self.assertEqual(symmetry(self.axisOnElement), 1)
         self.assertEqual(symmetry(self.axisOffElement), 1)
         self.assertEqual(symmetry(self.axisOnOffElement), 1)
+        self.assertEqual(symmetry(self.spin2), 0)
+        self.assertEqual(symmetry(self.square), 2)
 
 
 if __name__ == '__main__':
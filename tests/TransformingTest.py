@@ -1,6 +1,6 @@
 import unittest
 
-from ring_seq.methods import rotate_left, rotate_right, start_at, reflect_at
+from ring_seq.methods import DihedralTransform, rotate_left, rotate_right, start_at, reflect_at
 
 
 class TransformingOps(unittest.TestCase):
@@ -31,6 +31,23 @@ class TransformingOps(unittest.TestCase):
         self.assertEqual(reflect_at("ABCDE", 0), "AEDCB")
         self.assertEqual(reflect_at(["A", 1, 'B', 2], 0), ["A", 2, 'B', 1])
         self.assertEqual(reflect_at(("A", 1, 'B', 2), 0), ("A", 2, 'B', 1))
+        self.assertEqual(reflect_at("ABCDE", 7), "CBAED")
+        self.assertEqual(reflect_at("ABCDE", -1), "EDCBA")
+
+    def test_dihedral_transform(self):
+        rotation: DihedralTransform = DihedralTransform.rotate_right(1)
+        reflection: DihedralTransform = DihedralTransform.reflect_at(2)
+        self.assertEqual(DihedralTransform().apply("ABCDE"), "ABCDE")
+        self.assertEqual(rotation.apply("ABCDE"), rotate_right("ABCDE", 1))
+        self.assertEqual(reflection.apply(["A", 1, 'B', 2]), reflect_at(["A", 1, 'B', 2], 2))
+        self.assertEqual(rotation.then(reflection), DihedralTransform(1, True))
+        self.assertEqual(reflection.then(rotation), DihedralTransform(3, True))
+        self.assertEqual(reflection.then(reflection), DihedralTransform(0))
+        chain: DihedralTransform = rotation.then(reflection).then(DihedralTransform.rotate_left(3))
+        expected: str = rotate_left(reflect_at(rotate_right("ABCDE", 1), 2), 3)
+        self.assertEqual(chain.apply("ABCDE"), expected)
+        self.assertEqual(chain.view("ABCDE")[:], expected)
+        self.assertEqual(DihedralTransform.start_at(2).then(DihedralTransform.start_at(-2)).apply((1, 2, 3)), (1, 2, 3))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,64 @@
+import unittest
+
+from ring_seq.methods import RingView, reflect_at, reflect_at_view, rotate_left_view, rotate_right_view, start_at, \
+    start_at_view
+
+
+class ViewingOps(unittest.TestCase):
+
+    def test_rotate_right_view(self):
+        self.assertEqual(list(rotate_right_view("ABCDE", 1)), list("EABCD"))
+        self.assertEqual(rotate_right_view(["A", 1, 'B', 2], 3)[:], [1, 'B', 2, "A"])
+
+    def test_rotate_left_view(self):
+        self.assertEqual(list(rotate_left_view("ABCDE", 1)), list("BCDEA"))
+        self.assertEqual(rotate_left_view(("A", 1, 'B', 2), -1)[:], (2, "A", 1, 'B'))
+
+    def test_start_at_view(self):
+        view: RingView = start_at_view("ABCDE", 6)
+        self.assertEqual(len(view), 5)
+        self.assertEqual(view[0], "B")
+        self.assertEqual(view[-1], "A")
+        with self.assertRaises(IndexError):
+            var = view[5]
+        self.assertEqual(view[:], "BCDEA")
+        self.assertEqual(view[1:4], "CDE")
+        self.assertEqual(view[::2], "BDA")
+        self.assertEqual(view[::-1], "AEDCB")
+        self.assertEqual(list(reversed(view)), list("AEDCB"))
+        self.assertTrue("E" in view)
+        self.assertEqual(view.index("E"), 3)
+
+    def test_reflect_at_view(self):
+        view: RingView = reflect_at_view("ABCDE", 1)
+        self.assertEqual(list(view), list("BAEDC"))
+        self.assertEqual(view[1], "A")
+        self.assertEqual(view[:], "BAEDC")
+        self.assertEqual(view[3:0:-2], "DA")
+        self.assertEqual(list(reversed(view)), list("CDEAB"))
+        self.assertEqual(reflect_at_view([1, 2, 3, 4])[:], [1, 4, 3, 2])
+
+    def test_views_as_transformations(self):
+        for i in range(-6, 7):
+            self.assertEqual(start_at_view("ABCDE", i)[:], start_at("ABCDE", i))
+            self.assertEqual(reflect_at_view("ABCDE", i)[:], reflect_at("ABCDE", i))
+            for s in [slice(1, 4), slice(4, 1, -1), slice(None, None, 3), slice(-1, None, -2)]:
+                self.assertEqual(start_at_view("ABCDE", i)[s], start_at("ABCDE", i)[s])
+                self.assertEqual(reflect_at_view("ABCDE", i)[s], reflect_at("ABCDE", i)[s])
+
+    def test_views_equality(self):
+        self.assertEqual(start_at_view("ABCDE", 1), "BCDEA")
+        self.assertEqual(start_at_view("ABCDE", 1), reflect_at_view("AEDCB", 4))
+        self.assertNotEqual(start_at_view("ABCDE", 1), "ABCDE")
+        self.assertNotEqual(start_at_view("ABCDE", 1), list("BCDEA"))
+
+    def test_empty_view(self):
+        view: RingView = start_at_view("", 0)
+        self.assertEqual(len(view), 0)
+        self.assertEqual(list(view), [])
+        self.assertEqual(list(reflect_at_view([])), [])
+        self.assertEqual(view[:], "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,7 +17,7 @@ class RingOps(unittest.TestCase):
 
     def test_rotation_1_step_right(self):
         self.ring.rotate_r(1)
-        self.assertEqual(self.ring.head_index, -1)
+        self.assertEqual(self.ring.head_index, 3)
         self.assertEqual(self.ring.is_reflected, False)
         self.assertEqual(self.ring.current_head(), 4)
         self.assertEqual(self.ring.current(), [4, 1, 2, 3])
@@ -64,6 +64,35 @@ class RingOps(unittest.TestCase):
         self.assertEqual(self.ring.current_head(), 1)
         self.assertEqual(self.ring.current(), self.seq)
 
+    def test_normalized_head_index(self):
+        self.ring.rotate_l(4 * 1000000 + 1)
+        self.assertEqual(self.ring.head_index, 1)
+        self.assertEqual(Ring(self.seq, -5).head_index, 3)
+        self.assertEqual(Ring([]).head_index, 0)
+
+    def test_indexing(self):
+        self.ring.reflect()
+        self.ring.rotate_r(1)
+        self.assertEqual(len(self.ring), 4)
+        self.assertEqual(self.ring[0], 2)
+        self.assertEqual(self.ring[-1], 3)
+        self.assertEqual(list(self.ring), [2, 1, 4, 3])
+        self.assertEqual(self.ring[1:3], [1, 4])
+        self.assertEqual(list(self.ring.view()), self.ring.current())
+        with self.assertRaises(IndexError):
+            var = self.ring[4]
+
+    def test_cached_current(self):
+        self.ring.rotate_r(1)
+        current = self.ring.current()
+        self.assertIs(self.ring.current(), current)
+        self.ring.rotate_r(4)
+        self.assertIs(self.ring.current(), current)
+        self.ring.reflect()
+        self.assertEqual(self.ring.current(), [4, 3, 2, 1])
+        self.ring.head_index = 0
+        self.assertEqual(self.ring.current(), [1, 4, 3, 2])
+
 
 if __name__ == '__main__':
     unittest.main()